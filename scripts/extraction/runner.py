@@ -1,5 +1,16 @@
-import json, argparse
-from onchaindata.utils.etherscan_extract import etherscan_to_parquet
+import argparse
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import orjson
+
+from onchaindata.utils.chain import get_chainid, is_address
+from onchaindata.utils.etherscan_extract import (
+    etherscan_to_parquet,
+    get_etherscan_client,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def main():
@@ -26,27 +37,78 @@ def main():
         help="End block number",
         default=None,
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        help="Number of contract and table extractions run concurrently",
+        default=4,
+    )
+    parser.add_argument(
+        "--min-new-blocks",
+        type=int,
+        help="Skip contracts whose extracted data is fewer than this many blocks behind",
+        default=1,
+    )
     args = parser.parse_args()
 
-    contracts = json.load(open("scripts/extraction/contracts.json"))
+    with open("scripts/extraction/contracts.json", "rb") as f:
+        contracts = orjson.loads(f.read())
+    invalid = [
+        name for name, details in contracts.items() if not is_address(details["address"])
+    ]
+    if invalid:
+        raise ValueError(f"Invalid contract addresses for: {', '.join(invalid)}")
 
-    for name, details in contracts.items():
-        if args.logs:
-            etherscan_to_parquet(
-                address=details["address"],
-                chain=details["chain"],
-                table="logs",
-                from_block=args.from_block,
-                to_block=args.to_block,
+    # Several names may point at the same contract; extract each one only once.
+    # Addresses are lowercased here so nothing downstream has to normalize them.
+    unique_contracts = {
+        (details["chain"], details["address"].lower()): (
+            name,
+            {"chain": details["chain"], "address": details["address"].lower()},
+        )
+        for name, details in contracts.items()
+    }
+
+    tables = [
+        table
+        for table, enabled in (("logs", args.logs), ("transactions", args.transactions))
+        if enabled
+    ]
+
+    # Warm the creation-block cache with batched requests, one set per chain,
+    # instead of one lookup per contract
+    addresses_by_chain = {}
+    for chain, address in unique_contracts:
+        addresses_by_chain.setdefault(chain, []).append(address)
+    for chain, addresses in addresses_by_chain.items():
+        try:
+            get_etherscan_client(get_chainid(chain)).get_contract_creation_blocks(
+                addresses
             )
-        if args.transactions:
+        except Exception as e:
+            logger.warning(f"Could not prefetch creation blocks on {chain}: {e}")
+
+    def extract(name, details, table):
+        try:
             etherscan_to_parquet(
                 address=details["address"],
                 chain=details["chain"],
-                table="transactions",
+                table=table,
                 from_block=args.from_block,
                 to_block=args.to_block,
+                min_new_blocks=args.min_new_blocks,
             )
+        except Exception as e:
+            logger.error(f"Failed to extract {table} for {name}: {e}")
+
+    # Contracts on the same chain share one rate-limited Etherscan client
+    with ThreadPoolExecutor(max_workers=args.max_workers) as executor:
+        futures = [
+            executor.submit(extract, name, details, table)
+            for name, details in unique_contracts.values()
+            for table in tables
+        ]
+        wait(futures)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 """Abstract base classes for onchaindata package."""
 
 import time
+import random
 import logging
 import requests
 from abc import ABC, abstractmethod
@@ -139,9 +140,12 @@ class BaseAPIClient(ABC, metaclass=AutoRegisterMeta):
             except Exception as e:
                 last_exception = e
                 if attempt < self.config.retry_attempts - 1:
-                    delay = self.config.retry_delay_base * (2**attempt)
+                    # Jitter spreads out retries from threads that failed together
+                    delay = min(
+                        self.config.retry_delay_base * (2**attempt) + random.random(), 60
+                    )
                     self.logger.warning(
-                        f"Request failed (attempt {attempt + 1}): {e}. Retrying in {delay}s..."
+                        f"Request failed (attempt {attempt + 1}): {e}. Retrying in {delay:.1f}s..."
                     )
                     time.sleep(delay)
                 else:
@@ -1,42 +1,76 @@
 """Historical data extraction to Parquet files."""
 
+import csv
 import logging
-import json
 import os
+import threading
+import time
 
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Literal, Any
+from typing import Dict, List, Optional, Literal, Any, Union
 
+import orjson
 import polars as pl
-import pandas as pd
+import pyarrow.parquet as pq
 import dlt
 from dlt.sources.rest_api import rest_api_source
 from dlt.sources.helpers.rest_client import paginators
 
-from .exceptions import APIError
+from .exceptions import APIError, ResultWindowError
 from .base import BaseAPIClient, BaseSource, APIConfig
 from ..config import APIUrls, APIs
+from ..utils.chain import load_chainid_mapping
+
+# zstd keeps files small for resume/load reads; smaller row groups give finer
+# blockNumber statistics for row-group pruning
+PARQUET_WRITE_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "statistics": True,
+    "row_group_size": 64_000,
+}
+
+# Wei amounts overflow Int64, and pyarrow (used for footer reads) can't open
+# 128-bit integer columns, so these are always stored as 38-digit decimals
+WEI_COLUMNS = ("value",)
+
+
+def _records_to_frame(data: List[Dict[str, Any]]) -> pl.DataFrame:
+    """Build a DataFrame from fetched records with Parquet-safe column types."""
+    # Infer from every row: a wei amount past the first rows may not fit in
+    # the Int64 inferred from them
+    df = pl.DataFrame(data, infer_schema_length=None)
+    return df.with_columns(
+        pl.col(name).cast(pl.Decimal(38, 0))
+        for name, dtype in df.schema.items()
+        if name in WEI_COLUMNS or dtype == pl.Int128
+    )
 
 
 class EtherscanClient(BaseAPIClient):
-    """Etherscan API client implementation."""
+    """Etherscan API client implementation.
+
+    Contract ABIs and creation info (immutable) and the latest block (short TTL)
+    are cached per chainid at class level, so every client in a run shares the
+    lookups. Creation info is also persisted to CREATION_INFO_CACHE_FILE, so
+    restarts don't re-query it.
+    """
+
+    LATEST_BLOCK_TTL = 30.0  # seconds
+    CREATION_INFO_BATCH_SIZE = 5  # max addresses per getcontractcreation call
+    CREATION_INFO_CACHE_FILE = Path("data/cache/creation_blocks.json")
+
+    _cache_lock = threading.Lock()
+    _abi_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+    _creation_info_cache: Dict[tuple, Dict[str, Any]] = {}
+    _latest_block_cache: Dict[int, tuple] = {}
+    _creation_info_cache_loaded = False
 
     @classmethod
     def _load_chainid_mapping(cls) -> Dict[str, int]:
         """Load chain name to chainid mapping from resource file."""
-        # Get the path to the chainid.json file relative to this module
-        chainid_path = Path(__file__).parent.parent / "config/chainid.json"
-
-        try:
-            with chainid_path.open("r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            raise FileNotFoundError(
-                f"Chain ID mapping file not found at {chainid_path}"
-            )
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON in chain ID mapping file: {e}")
+        return load_chainid_mapping()
 
     def __init__(
         self,
@@ -96,7 +130,17 @@ class EtherscanClient(BaseAPIClient):
     def get_latest_block(
         self, timestamp: Optional[int] = None, closest: str = "before"
     ) -> int:
-        """Get the latest block number or block closest to timestamp."""
+        """Get the latest block number or block closest to timestamp.
+
+        The latest block (no timestamp given) is cached for LATEST_BLOCK_TTL seconds.
+        """
+        use_cache = timestamp is None and closest == "before"
+        if use_cache:
+            with self._cache_lock:
+                cached = self._latest_block_cache.get(self.chainid)
+            if cached and time.monotonic() - cached[0] < self.LATEST_BLOCK_TTL:
+                return cached[1]
+
         if timestamp is None:
             timestamp = int(datetime.now().timestamp())
 
@@ -111,7 +155,12 @@ class EtherscanClient(BaseAPIClient):
         result = self.make_request("", params)
 
         latest_block = int(result)
-        pass  # Latest block retrieved
+        if use_cache:
+            with self._cache_lock:
+                self._latest_block_cache[self.chainid] = (
+                    time.monotonic(),
+                    latest_block,
+                )
         return latest_block
 
     def get_contract_abi(
@@ -126,13 +175,7 @@ class EtherscanClient(BaseAPIClient):
             contract_metadata = {}
 
         # Fetch main contract ABI
-        params = {
-            "module": "contract",
-            "action": "getabi",
-            "address": address,
-        }
-        result = self.make_request("", params)
-        abi = json.loads(result)
+        abi = self._get_abi(address)
 
         # Check if it's a proxy and fetch implementation ABI
         implementation_abi = None
@@ -142,13 +185,7 @@ class EtherscanClient(BaseAPIClient):
             if implementation_address:
                 pass  # Contract is a proxy, fetching implementation ABI
                 try:
-                    impl_params = {
-                        "module": "contract",
-                        "action": "getabi",
-                        "address": implementation_address,
-                    }
-                    impl_result = self.make_request("", impl_params)
-                    implementation_abi = json.loads(impl_result)
+                    implementation_abi = self._get_abi(implementation_address)
                 except Exception as e:
                     self.logger.warning(
                         f"Could not fetch implementation ABI for {implementation_address}: {e}"
@@ -161,6 +198,28 @@ class EtherscanClient(BaseAPIClient):
 
         return abi, implementation_abi
 
+    def _get_abi(self, address: str) -> List[Dict[str, Any]]:
+        """Fetch the verified ABI of an address, cached per (chainid, address).
+
+        Only the ABI itself is cached: proxy metadata is re-fetched every time
+        because a proxy's implementation can be upgraded.
+        """
+        key = (self.chainid, address.lower())
+        with self._cache_lock:
+            abi = self._abi_cache.get(key)
+        if abi is not None:
+            return abi
+
+        params = {
+            "module": "contract",
+            "action": "getabi",
+            "address": address,
+        }
+        abi = orjson.loads(self.make_request("", params))
+        with self._cache_lock:
+            self._abi_cache[key] = abi
+        return abi
+
     def get_contract_metadata(self, address: str) -> Dict[str, Any]:
         """Get contract metadata including proxy status."""
         pass  # Fetching metadata for contract
@@ -186,6 +245,21 @@ class EtherscanClient(BaseAPIClient):
         """Get contract creation block number for given address."""
         return int(self.get_contract_creation_info(address)["blockNumber"])
 
+    def get_contract_creation_blocks(self, addresses: List[str]) -> Dict[str, int]:
+        """Get creation block numbers for many addresses in batched requests.
+
+        Returns:
+            Mapping of lowercased address to creation block number
+        """
+        addresses = list(addresses)
+        infos = self.get_contract_creation_info(addresses)
+        if len(addresses) == 1:
+            infos = [infos]
+        return {
+            address.lower(): int(info["blockNumber"])
+            for address, info in zip(addresses, infos)
+        }
+
     def get_transaction_receipt(
         self, txhash: str, save: bool = True, save_dir: str = "data/receipts"
     ) -> Dict[str, Any]:
@@ -215,22 +289,92 @@ class EtherscanClient(BaseAPIClient):
     def get_contract_creation_info(
         self, contract_addresses: List[str]
     ) -> Dict[str, Any]:
-        """Get contract creation information for one or more addresses."""
+        """Get contract creation information for one or more addresses.
+
+        Results are cached per (chainid, address); only unseen addresses are
+        requested, up to CREATION_INFO_BATCH_SIZE per call.
+        """
         if isinstance(contract_addresses, str):
             contract_addresses = [contract_addresses]
 
-        pass  # Getting creation info for contracts
+        keys = [(self.chainid, address.lower()) for address in contract_addresses]
+        with self._cache_lock:
+            self._load_creation_info_cache()
+            missing = [
+                address
+                for address, key in zip(contract_addresses, keys)
+                if key not in self._creation_info_cache
+            ]
 
-        params = {
-            "module": "contract",
-            "action": "getcontractcreation",
-            "contractaddresses": ",".join(contract_addresses),
-        }
-        result = self.make_request("", params)
+        for i in range(0, len(missing), self.CREATION_INFO_BATCH_SIZE):
+            params = {
+                "module": "contract",
+                "action": "getcontractcreation",
+                "contractaddresses": ",".join(
+                    missing[i : i + self.CREATION_INFO_BATCH_SIZE]
+                ),
+            }
+            result = self.make_request("", params)
+            if not isinstance(result, list):
+                result = [result]
+
+            with self._cache_lock:
+                for info in result:
+                    key = (self.chainid, info["contractAddress"].lower())
+                    self._creation_info_cache[key] = info
+                self._save_creation_info_cache()
+
+        with self._cache_lock:
+            infos = [self._creation_info_cache.get(key) for key in keys]
+        for address, info in zip(contract_addresses, infos):
+            if info is None:
+                raise APIError(f"No contract creation info found for {address}")
 
         if len(contract_addresses) == 1:
-            return result[0] if isinstance(result, list) else result
-        return result
+            return infos[0]
+        return infos
+
+    @classmethod
+    def _load_creation_info_cache(cls) -> None:
+        """Fill the creation info cache from disk, once per process.
+
+        Callers must hold _cache_lock.
+        """
+        if cls._creation_info_cache_loaded:
+            return
+        cls._creation_info_cache_loaded = True
+        try:
+            saved = orjson.loads(cls.CREATION_INFO_CACHE_FILE.read_bytes())
+        except FileNotFoundError:
+            return
+        except orjson.JSONDecodeError as e:
+            logging.getLogger(cls.__name__).warning(
+                f"Ignoring unreadable {cls.CREATION_INFO_CACHE_FILE}: {e}"
+            )
+            return
+        for key, info in saved.items():
+            chainid, address = key.split(":", 1)
+            cls._creation_info_cache.setdefault((int(chainid), address), info)
+
+    @classmethod
+    def _save_creation_info_cache(cls) -> None:
+        """Write the creation info cache to disk, keyed by "{chainid}:{address}".
+
+        The file is replaced atomically. Callers must hold _cache_lock.
+        """
+        path = cls.CREATION_INFO_CACHE_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_bytes(
+            orjson.dumps(
+                {
+                    f"{chainid}:{address}": info
+                    for (chainid, address), info in cls._creation_info_cache.items()
+                },
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+            )
+        )
+        os.replace(tmp_path, path)
 
     def _save_abi(
         self,
@@ -245,29 +389,32 @@ class EtherscanClient(BaseAPIClient):
         # create a csv file with the following columns: address, implementation_address
         csv_path = os.path.join(save_dir, "implementation.csv")
 
-        # Check if file exists to determine whether to write headers
-        if not os.path.exists(csv_path):
-            # Create new file with headers
-            with open(csv_path, "w") as f:
-                f.write("address,implementation_address\n")
+        # Append the pair unless it is already recorded, writing headers for a new file
+        row = [address, str(implementation_address)]
+        try:
+            with open(csv_path, newline="") as f:
+                existing_rows = list(csv.reader(f))
+        except FileNotFoundError:
+            existing_rows = []
 
-        with open(csv_path, "a") as f:
-            f.write(f"{address},{implementation_address}\n")
-        df = pd.read_csv(csv_path)
-        df = df.drop_duplicates()
-        df.to_csv(csv_path, index=False)
+        if row not in existing_rows[1:]:
+            with open(csv_path, "a", newline="") as f:
+                writer = csv.writer(f)
+                if not existing_rows:
+                    writer.writerow(["address", "implementation_address"])
+                writer.writerow(row)
 
         # Save main ABI
         main_path = os.path.join(save_dir, f"{address}.json")
-        with open(main_path, "w") as f:
-            json.dump(abi, f, indent=2)
+        with open(main_path, "wb") as f:
+            f.write(orjson.dumps(abi, option=orjson.OPT_INDENT_2))
         pass  # ABI saved
 
         # Save implementation ABI if available
         if implementation_abi:
             impl_path = os.path.join(save_dir, f"{implementation_address}.json")
-            with open(impl_path, "w") as f:
-                json.dump(implementation_abi, f, indent=2)
+            with open(impl_path, "wb") as f:
+                f.write(orjson.dumps(implementation_abi, option=orjson.OPT_INDENT_2))
             pass  # Implementation ABI saved
 
     def _save_receipt(self, txhash: str, receipt: Dict[str, Any], save_dir: str):
@@ -275,8 +422,8 @@ class EtherscanClient(BaseAPIClient):
         os.makedirs(save_dir, exist_ok=True)
 
         receipt_path = os.path.join(save_dir, f"{txhash}.json")
-        with open(receipt_path, "w") as f:
-            json.dump(receipt, f, indent=2)
+        with open(receipt_path, "wb") as f:
+            f.write(orjson.dumps(receipt, option=orjson.OPT_INDENT_2))
         pass  # Receipt saved
 
 
@@ -311,6 +458,29 @@ class EtherscanSource(BaseSource):
             }
         )
 
+    @staticmethod
+    def _raise_for_error_result(item: Any) -> None:
+        """Raise if a paginated response carried an error message instead of records.
+
+        Etherscan reports errors with HTTP 200 and a {"status": "0", "message",
+        "result"} envelope. Past the first page, dlt yields the string result
+        (e.g. once the request goes past the 10,000-record result window); when
+        the first page is an error, it yields the whole envelope as a record.
+        """
+        if isinstance(item, dict):
+            if item.get("status") != "0" or "message" not in item:
+                return
+            result = item.get("result")
+            message = result if isinstance(result, str) else item["message"]
+        else:
+            message = str(item)
+
+        if "result window" in message.lower():
+            raise ResultWindowError(message)
+        if "rate limit" in message.lower():
+            raise APIError(f"Rate limit exceeded: {message}")
+        raise APIError(f"API error: {message}")
+
     def logs(
         self,
         address: str,
@@ -338,6 +508,7 @@ class EtherscanSource(BaseSource):
             # Extract the resource from the source
             resource = list(source.resources.values())[0]
             for item in resource:
+                self._raise_for_error_result(item)
                 item["chainid"] = self.client.chainid
                 yield item
 
@@ -383,6 +554,7 @@ class EtherscanSource(BaseSource):
             # Extract the resource from the source
             resource = list(source.resources.values())[0]
             for item in resource:
+                self._raise_for_error_result(item)
                 item["chainid"] = self.client.chainid
                 yield item
 
@@ -413,6 +585,7 @@ class EtherscanExtractor:
         self.client = client
         self.save_dir = save_dir
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._created_part_dirs = set()
 
     def to_parquet(
         self,
@@ -438,47 +611,18 @@ class EtherscanExtractor:
         Returns:
             Path to the created Parquet file, or None if no data extracted
         """
-        self.logger.debug(
-            f"Extracting {table} for address {address} on {chain} from block {from_block} to {to_block}"
-        )
-
-        source = EtherscanSource(self.client)
-        data = []
-
         try:
-            if table == "logs":
-                resource = source.logs(
-                    address=address,
-                    from_block=from_block,
-                    to_block=to_block,
-                    offset=offset,
-                )
-
-                for record in resource:
-                    # Convert hex strings to integers for numeric fields
-                    record = self._process_hex_fields(record)
-                    record["contract_address"] = address
-                    record["chain"] = chain
-                    data.append(record)
-
-            elif table == "transactions":
-                resource = source.transactions(
-                    address=address,
-                    from_block=from_block,
-                    to_block=to_block,
-                    offset=offset,
-                )
-
-                for record in resource:
-                    # Convert hex strings to integers for numeric fields
-                    record = self._process_hex_fields(record)
-                    record["address"] = address
-                    record["chain"] = chain
-                    data.append(record)
-
-            if len(data) == 0:
-                self.logger.debug(f"No {table} extracted for address {address}")
-            return self._save_to_parquet(address, chain, table, data, output_path)
+            data = self.fetch(
+                address=address,
+                chain=chain,
+                table=table,
+                from_block=from_block,
+                to_block=to_block,
+                offset=offset,
+            )
+            output_path = self.get_output_path(address, chain, table, output_path)
+            self.save_to_parquet(address, chain, table, data, output_path)
+            return str(output_path)
 
         except APIError as e:
             self.logger.error(f"Failed to fetch {table} for {address}: {e}")
@@ -487,6 +631,67 @@ class EtherscanExtractor:
             self.logger.error(f"Unexpected error fetching {table} for {address}: {e}")
             return None
 
+    def fetch(
+        self,
+        address: str,
+        chain: str = "ethereum",
+        table: Literal["logs", "transactions"] = "logs",
+        from_block: int = 0,
+        to_block: str = "latest",
+        offset: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch and normalize records for a block range without writing them.
+
+        Unlike `to_parquet`, errors are raised so callers can record the failed range.
+
+        Args:
+            address: Contract address to extract data for
+            chain: Blockchain network (default: "ethereum")
+            table: Type of data to extract ("logs" or "transactions")
+            from_block: Starting block number
+            to_block: Ending block number or "latest"
+            offset: Number of records per API call
+
+        Returns:
+            List of records ready for `save_to_parquet`
+        """
+        # fetch runs once per chunk; skip building debug messages unless enabled
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(
+                f"Extracting {table} for address {address} on {chain} from block {from_block} to {to_block}"
+            )
+
+        # Stored addresses are always lowercase, so filters can compare them as-is
+        address = address.lower()
+        source = EtherscanSource(self.client)
+        data = []
+
+        if table == "logs":
+            resource_factory, address_field = source.logs, "contract_address"
+        elif table == "transactions":
+            resource_factory, address_field = source.transactions, "address"
+        else:
+            raise ValueError(f"Unknown table '{table}', expected 'logs' or 'transactions'")
+
+        resource = resource_factory(
+            address=address,
+            from_block=from_block,
+            to_block=to_block,
+            offset=offset,
+        )
+        for record in resource:
+            # Convert hex strings to integers for numeric fields
+            record = self._process_hex_fields(record)
+            record[address_field] = address
+            record["chain"] = chain
+            data.append(record)
+
+        if debug and len(data) == 0:
+            self.logger.debug(f"No {table} extracted for address {address}")
+        return data
+
     def _process_hex_fields(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """Convert numeric string fields to integers (handles both hex and decimal formats)."""
         numeric_fields = {
@@ -525,66 +730,203 @@ class EtherscanExtractor:
 
         return record
 
-    def _save_to_parquet(
+    def get_output_path(
         self,
         address: str,
         chain: str,
         table: str,
-        data: List[Dict[str, Any]],
         output_path: Optional[str] = None,
-    ) -> str:
-        """Save data to Parquet file organized by chain/table/address."""
-        # Create output directory structure: chain=ethereum/table=logs/address=0x123...
+    ) -> Path:
+        """Resolve the Parquet file for an address: output_path if given, else
+        {save_dir}/{chain}_{address}/{table}.parquet."""
         if output_path is None:
-            output_dir = Path(self.save_dir) / f"{chain}_{address}"
-            output_dir.mkdir(parents=True, exist_ok=True)
+            return Path(self.save_dir) / f"{chain}_{address}" / f"{table}.parquet"
+        return Path(output_path)
 
-            output_path = output_dir / f"{table}.parquet"
-        else:
-            # Ensure output_path is a Path object
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+    def save_to_parquet(
+        self,
+        address: str,
+        chain: str,
+        table: str,
+        data: List[Dict[str, Any]],
+        output_path: Optional[str] = None,
+    ) -> int:
+        """Save data to Parquet file organized by chain/table/address.
+
+        Returns:
+            Number of new rows added to the file (duplicates are dropped)
+        """
+        output_path = self.get_output_path(address, chain, table, output_path)
 
         if len(data) == 0:
             self.logger.debug(f"No {table} data to save for address {address}")
-            return str(output_path)
+            return 0
 
         try:
             # Create Polars DataFrame
-            new_lazy = pl.LazyFrame(data)
+            new_lazy = _records_to_frame(data).lazy()
+
+            self.upgrade_legacy_types(output_path)
+            # Reading the footer doubles as the existence check, so appending
+            # to an existing file costs no extra stat/mkdir calls
+            try:
+                existing_count = pq.read_metadata(output_path).num_rows
+            except FileNotFoundError:
+                existing_count = None
 
             # Save to Parquet (append if file exists)
-            if output_path.exists():
-                # Use scan_parquet for memory efficiency, then concatenate and collect
+            if existing_count is not None:
+                # Use scan_parquet for memory efficiency, then concatenate and sink
                 existing_lazy = pl.scan_parquet(output_path)
 
                 # Ensure column order matches between existing and new data
                 existing_columns = existing_lazy.collect_schema().names()
                 new_lazy = new_lazy.select(existing_columns)
 
-                combined_lazy = pl.concat([existing_lazy, new_lazy]).unique()
                 # only keep unique records, sometime dup happens especially running retry_failed_blocks
-
-                # Get count
-                existing_count = existing_lazy.select(pl.len()).collect().item()
-                combined_count = combined_lazy.select(pl.len()).collect().item()
-
-                if existing_count != combined_count:
-                    # Materialize and write the combined data
-                    combined_lazy.collect().write_parquet(output_path)
+                # keep rows sorted by block so the file can be streamed in block order
+                # The merge is streamed to a temp file and moved into place, so
+                # the existing file is never fully materialized in memory
+                tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+                (
+                    pl.concat([existing_lazy, new_lazy])
+                    .unique()
+                    .sort("blockNumber", maintain_order=True)
+                    .sink_parquet(tmp_path, **PARQUET_WRITE_OPTIONS)
+                )
+                rows_added = pq.read_metadata(tmp_path).num_rows - existing_count
+                if rows_added:
+                    os.replace(tmp_path, output_path)
                     self.logger.debug(
-                        f"{output_path}: Existing count: {existing_count}, added: {combined_count - existing_count}"
+                        f"{output_path}: Existing count: {existing_count}, added: {rows_added}"
                     )
                 else:
+                    tmp_path.unlink()
                     self.logger.debug(f"{output_path}: No new records to append")
 
             else:
                 # Write new file
-                new_lazy.collect().write_parquet(output_path)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                new = new_lazy.sort("blockNumber", maintain_order=True).collect()
+                new.write_parquet(output_path, **PARQUET_WRITE_OPTIONS)
+                rows_added = new.height
                 self.logger.debug(f"{output_path}: Created new file")
 
-            return str(output_path)
+            return rows_added
 
         except Exception as e:
             self.logger.error(f"Failed to save {table} data for address {address}: {e}")
             raise
+
+    @staticmethod
+    def get_parts_dir(output_path: Union[str, Path]) -> Path:
+        """Directory holding not yet compacted chunk files for output_path,
+        e.g. logs.parquet -> logs.parts/."""
+        output_path = Path(output_path)
+        return output_path.parent / f"{output_path.stem}.parts"
+
+    def write_part(
+        self,
+        data: List[Dict[str, Any]],
+        output_path: Union[str, Path],
+        from_block: int,
+        to_block: int,
+    ) -> int:
+        """Write one chunk of records as its own Parquet file next to output_path.
+
+        Unlike `save_to_parquet`, the cost does not grow with the size of the
+        output file. Parts are merged into it by `compact_parts`.
+
+        Returns:
+            Number of rows written
+        """
+        if len(data) == 0:
+            return 0
+
+        parts_dir = self.get_parts_dir(output_path)
+        if parts_dir not in self._created_part_dirs:
+            parts_dir.mkdir(parents=True, exist_ok=True)
+            self._created_part_dirs.add(parts_dir)
+        df = _records_to_frame(data).sort("blockNumber", maintain_order=True)
+        df.write_parquet(
+            parts_dir / f"part-{from_block:012d}-{to_block:012d}.parquet",
+            **PARQUET_WRITE_OPTIONS,
+        )
+        return df.height
+
+    def upgrade_legacy_types(self, output_path: Union[str, Path]) -> bool:
+        """Rewrite a file whose wei columns were stored as 128-bit integers.
+
+        Older versions wrote `value` as Int128 whenever a chunk held an amount
+        past Int64. pyarrow can't open such files, so they are rewritten once
+        with those columns as Decimal(38, 0), like newly written files.
+
+        Returns:
+            Whether the file was rewritten
+        """
+        output_path = Path(output_path)
+        try:
+            schema = pl.read_parquet_schema(output_path)
+        except FileNotFoundError:
+            return False
+        legacy_columns = [name for name, dtype in schema.items() if dtype == pl.Int128]
+        if not legacy_columns:
+            return False
+
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+        (
+            pl.scan_parquet(output_path)
+            .with_columns(pl.col(legacy_columns).cast(pl.Decimal(38, 0)))
+            .sink_parquet(tmp_path, **PARQUET_WRITE_OPTIONS)
+        )
+        os.replace(tmp_path, output_path)
+        self.logger.info(
+            f"{output_path}: Rewrote {', '.join(legacy_columns)} as Decimal(38, 0)"
+        )
+        return True
+
+    def compact_parts(self, output_path: Union[str, Path]) -> int:
+        """Merge the part files of output_path into it in a single rewrite.
+
+        Duplicates are dropped and rows are kept sorted by blockNumber. The merged
+        file is written next to the output and moved into place, so an interrupted
+        compaction leaves the previous file and the parts intact. A legacy output
+        file is upgraded first (see `upgrade_legacy_types`), even without parts.
+
+        Returns:
+            Number of new rows added to output_path
+        """
+        output_path = Path(output_path)
+        self.upgrade_legacy_types(output_path)
+        parts_dir = self.get_parts_dir(output_path)
+        parts = sorted(parts_dir.glob("part-*.parquet"))
+        if not parts:
+            return 0
+
+        try:
+            existing_count = pq.read_metadata(output_path).num_rows
+            sources = [pl.scan_parquet(output_path)]
+        except FileNotFoundError:
+            existing_count = 0
+            sources = []
+
+        sources.extend(pl.scan_parquet(part) for part in parts)
+        tmp_path = output_path.with_name(f"{output_path.name}.tmp")
+        (
+            pl.concat(sources, how="diagonal_relaxed")
+            .unique()
+            .sort("blockNumber", maintain_order=True)
+            .sink_parquet(tmp_path, **PARQUET_WRITE_OPTIONS)
+        )
+        rows_added = pq.read_metadata(tmp_path).num_rows - existing_count
+        os.replace(tmp_path, output_path)
+
+        for part in parts:
+            part.unlink()
+        parts_dir.rmdir()
+        self._created_part_dirs.discard(parts_dir)
+
+        self.logger.debug(
+            f"{output_path}: Compacted {len(parts)} parts, added: {rows_added}"
+        )
+        return rows_added
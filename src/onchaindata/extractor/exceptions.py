@@ -13,6 +13,13 @@ class APIError(EVMSleuthError):
     pass
 
 
+class ResultWindowError(APIError):
+    """Exception raised when a query matches more records than the API's result
+    window lets it page through."""
+
+    pass
+
+
 class ConfigurationError(EVMSleuthError):
     """Exception raised for configuration-related errors."""
 
@@ -2,7 +2,10 @@
 
 import time
 import logging
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from enum import Enum
 from typing import Optional
 
@@ -14,28 +17,51 @@ class RateLimitStrategy(Enum):
 
 
 class RateLimitedSession(requests.Session):
-    """Enhanced rate-limited session with multiple strategies."""
+    """Enhanced rate-limited session with multiple strategies.
+
+    Rate limiting is applied in `send()`, which every request goes through:
+    `request()`/`get()` as well as clients that prepare requests and send them
+    directly (e.g. dlt's RESTClient). Safe to share between threads: send start
+    times are spaced under a lock, and the connection pool is sized so
+    concurrent workers reuse keep-alive connections instead of discarding them.
+    Throttled (429) and transient 5xx responses are retried by the adapter,
+    honouring any Retry-After header.
+    """
     
     def __init__(
         self, 
         calls_per_second: float = 5.0, 
         strategy: RateLimitStrategy = RateLimitStrategy.FIXED_INTERVAL,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        pool_maxsize: int = 32,
     ):
         super().__init__()
+        retry = Retry(
+            total=3,
+            backoff_factor=1.0,
+            status_forcelist=[429, 500, 502, 503, 504],
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize, pool_maxsize=pool_maxsize, max_retries=retry
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
         self.calls_per_second = calls_per_second
         self.strategy = strategy
         self.logger = logger or logging.getLogger(__name__)
         self.last_request_time = 0
         self.request_count = 0
         self.min_interval = 1.0 / calls_per_second
+        self._rate_lock = threading.Lock()
         
-    def request(self, method: str, url: str, **kwargs) -> requests.Response:
-        """Make a rate-limited request."""
-        self._apply_rate_limiting()
-        self.request_count += 1
-        response = super().request(method, url, **kwargs)
-        return response
+    def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:
+        """Send a prepared request once the rate limit allows it."""
+        with self._rate_lock:
+            self._apply_rate_limiting()
+            self.request_count += 1
+        return super().send(request, **kwargs)
         
     def _apply_rate_limiting(self):
         """Apply rate limiting based on configured strategy."""
@@ -1,17 +1,47 @@
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+import orjson
+
+_CHAINID_JSON = Path(__file__).parent.parent / "config/chainid.json"
+
+
+@lru_cache(maxsize=1)
+def load_chainid_mapping() -> Dict[str, int]:
+    """Load the chain name to chainid mapping from config/chainid.json (cached).
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    try:
+        return orjson.loads(_CHAINID_JSON.read_bytes())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Chain ID mapping file not found at {_CHAINID_JSON}")
+    except orjson.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in chain ID mapping file: {e}")
 
 
 def get_chainid(chain: str, chainid_data: Optional[dict] = None) -> int:
     """Get the chainid for a given chain name."""
-    chainid_json = Path(__file__).parent.parent / "config/chainid.json"
     if chainid_data is None:
-        with open(chainid_json, "r") as f:
-            chainid_data = json.load(f)
-            pass  # Loaded chainid.json
+        chainid_data = load_chainid_mapping()
     try:
         chainid = chainid_data[chain]
         return chainid
     except KeyError:
         raise ValueError(f"Chain {chain} not found in .config/chainid.json")
+
+
+def is_address(value) -> bool:
+    """Check whether a value is a 0x-prefixed, 20-byte hex address (any case)."""
+    if not (isinstance(value, str) and len(value) == 42 and value.startswith("0x")):
+        return False
+    hex_part = value[2:]
+    # bytes.fromhex tolerates whitespace between bytes, so reject it first
+    if not hex_part.isalnum():
+        return False
+    try:
+        bytes.fromhex(hex_part)
+    except ValueError:
+        return False
+    return True
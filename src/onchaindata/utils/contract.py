@@ -1,26 +1,241 @@
-import os, json, logging
+import os, re, json, logging, hashlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import orjson
 import pandas as pd
-from web3 import Web3
+from eth_abi import decode as abi_decode
+from eth_abi.exceptions import InsufficientDataBytes
+from eth_hash.auto import keccak
+
+from ..extractor.base import BaseDecoder
+from ..extractor.exceptions import DecodingError
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def event_topic(signature: str) -> str:
+    """
+    Get the topic0 of an event signature, e.g. "Transfer(address,address,uint256)".
+    Hashes with eth-hash's native backend directly and memoizes per signature.
+    """
+    return "0x" + keccak(signature.encode()).hex()
+
+
+@lru_cache(maxsize=128)
+def load_abi(path: str) -> Tuple[Dict[str, Any], ...]:
+    """
+    Load an ABI JSON file with orjson, cached per path. Returned as a tuple so the
+    cached ABI can't be mutated in place by callers.
+    """
+    return tuple(orjson.loads(Path(path).read_bytes()))
+
+
+def _canonical_type(param: Dict[str, Any]) -> str:
+    """Canonical ABI type of an event input, expanding tuples to (t1,t2,...)."""
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(_canonical_type(c) for c in param["components"])
+        return f"({components}){abi_type[len('tuple'):]}"
+    return abi_type
+
+
+def event_signature(event_abi: Dict[str, Any]) -> str:
+    """Get the signature of an event ABI entry, e.g. "Transfer(address,address,uint256)"."""
+    types = ",".join(_canonical_type(p) for p in event_abi.get("inputs", []))
+    return f"{event_abi['name']}({types})"
+
+
+_event_index_cache: Dict[bytes, Dict[str, Dict[str, Any]]] = {}
+
+
+def build_event_index(abi: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Map topic0 -> event ABI for every event in a contract ABI, for constant-time
+    lookup of the event behind a log. Built once per distinct ABI (keyed by content hash).
+    """
+    abi_hash = hashlib.blake2b(json.dumps(abi, sort_keys=True).encode()).digest()
+    index = _event_index_cache.get(abi_hash)
+    if index is None:
+        index = {
+            event_topic(event_signature(entry)): entry
+            for entry in abi
+            if entry.get("type") == "event"
+        }
+        _event_index_cache[abi_hash] = index
+    return index
+
+
+def _topic_expression(abi_type: str, position: int) -> str:
+    """Python expression decoding an indexed value of abi_type from topics[position]."""
+    topic = f"topics[{position}]"
+    if abi_type == "address":
+        return f'"0x" + {topic}[-40:]'
+    if re.fullmatch(r"uint\d*", abi_type):
+        return f"int({topic}, 16)"
+    if re.fullmatch(r"int\d*", abi_type):
+        return f'int.from_bytes(bytes.fromhex({topic}[2:]), "big", signed=True)'
+    if abi_type == "bool":
+        return f"int({topic}, 16) != 0"
+    match = re.fullmatch(r"bytes(\d+)", abi_type)
+    if match:
+        # bytesN is left-aligned in the topic word
+        return f"{topic}[:{2 + 2 * int(match.group(1))}]"
+    # The keccak hash of an indexed dynamic value (string, bytes, arrays, tuples)
+    return topic
+
+
+def _word_expression(abi_type: str, offset: int) -> Optional[str]:
+    """
+    Python expression decoding a static one-word value of abi_type from the data
+    bytes at offset, or None if the type needs the generic eth_abi decoder.
+    """
+    word = f"data[{offset}:{offset + 32}]"
+    if abi_type == "address":
+        return f'"0x" + data[{offset + 12}:{offset + 32}].hex()'
+    if re.fullmatch(r"uint\d*", abi_type):
+        return f'int.from_bytes({word}, "big")'
+    if re.fullmatch(r"int\d*", abi_type):
+        return f'int.from_bytes({word}, "big", signed=True)'
+    if abi_type == "bool":
+        return f"data[{offset + 31}] != 0"
+    match = re.fullmatch(r"bytes(\d+)", abi_type)
+    if match:
+        return f'"0x" + data[{offset}:{offset + int(match.group(1))}].hex()'
+    return None
+
+
+def _value_expression(abi_type: str, value: str) -> str:
+    """
+    Python expression normalizing a value returned by eth_abi for abi_type to the
+    representation of the one-word decoders (lowercase addresses, hex bytes).
+    """
+    if abi_type == "address":
+        return f"{value}.lower()"
+    if re.fullmatch(r"bytes\d*", abi_type):
+        return f'"0x" + {value}.hex()'
+    return value
+
+
+def build_specialized_decoder(
+    event_abi: Dict[str, Any],
+) -> Callable[[List[str], bytes], Dict[str, Any]]:
+    """
+    Generate a decoder for one event with its topic offsets and data types hardcoded,
+    so decoding a log skips the per-log walk over the ABI inputs.
+
+    When every non-indexed input is a one-word static type (uintN, intN, address,
+    bool, bytesN), the data is sliced into 32-byte words and decoded with
+    int.from_bytes and friends, skipping eth_abi entirely.
+
+    The returned function takes (topics, data): hex topics as returned by Etherscan
+    and the raw non-indexed data bytes, and returns {input_name: value}. Addresses
+    are returned lowercase and bytes/bytesN values as 0x-prefixed hex strings,
+    whichever path decoded them. Data shorter than the static inputs raises
+    InsufficientDataBytes, as eth_abi does. An input named "event" is returned
+    as "event_", so it can't clash with the event name EventLogDecoder adds.
+    """
+    inputs = event_abi.get("inputs", [])
+    data_types = [_canonical_type(p) for p in inputs if not p.get("indexed")]
+    word_expressions = [
+        _word_expression(abi_type, 32 * j) for j, abi_type in enumerate(data_types)
+    ]
+    fully_static = all(expr is not None for expr in word_expressions)
+
+    fields = []
+    data_position = 0
+    topic_position = 1
+    for i, param in enumerate(inputs):
+        name = param.get("name") or f"arg{i}"
+        if name == "event":
+            name = "event_"
+        if param.get("indexed"):
+            expr = _topic_expression(_canonical_type(param), topic_position)
+            topic_position += 1
+        elif fully_static:
+            expr = word_expressions[data_position]
+            data_position += 1
+        else:
+            expr = _value_expression(
+                data_types[data_position], f"values[{data_position}]"
+            )
+            data_position += 1
+        fields.append(f"{name!r}: {expr}")
+
+    lines = ["def _decode(topics, data):"]
+    if data_types and fully_static:
+        data_size = 32 * len(data_types)
+        lines.append(f"    if len(data) < {data_size}:")
+        lines.append(
+            f"        raise _InsufficientDataBytes("
+            f'f"Tried to read {data_size} bytes, only got {{len(data)}} bytes.")'
+        )
+    elif data_types:
+        lines.append("    values = _abi_decode(_DATA_TYPES, data)")
+    lines.append("    return {" + ", ".join(fields) + "}")
+
+    namespace = {
+        "_abi_decode": abi_decode,
+        "_InsufficientDataBytes": InsufficientDataBytes,
+        "_DATA_TYPES": tuple(data_types),
+    }
+    exec("\n".join(lines), namespace)
+    return namespace["_decode"]
+
+
+class EventLogDecoder(BaseDecoder):
+    """Decodes raw logs of one contract with per-event specialized decoders.
+
+    Decoders are generated lazily on the first log of each topic0 and reused.
+    They are cached per instance (per ABI): the same topic0 can have different
+    indexed layouts in different ABIs (e.g. ERC20 vs ERC721 Transfer).
+
+    Example:
+        decoder = EventLogDecoder(load_abi("data/abi/0x123....json"))
+        decoded = decoder.decode({"topics": [...], "data": "0x..."})
+    """
+
+    def __init__(self, abi: List[Dict[str, Any]]):
+        super().__init__()
+        self.event_index = build_event_index(abi)
+        self._decoders: Dict[str, Callable[[List[str], bytes], Dict[str, Any]]] = {}
+
+    def decode(self, data: Dict[str, Any], **kwargs) -> Optional[Dict[str, Any]]:
+        """Decode a log with "topics" and "data"; None if its event is not in the ABI."""
+        topics = data["topics"]
+        if not topics:
+            return None
+
+        topic0 = topics[0].lower()
+        decoder = self._decoders.get(topic0)
+        if decoder is None:
+            event_abi = self.event_index.get(topic0)
+            if event_abi is None:
+                return None
+            decoder = self._decoders[topic0] = build_specialized_decoder(event_abi)
+
+        payload = data.get("data") or "0x"
+        try:
+            args = decoder(topics, bytes.fromhex(payload[2:]))
+        except Exception as e:
+            raise DecodingError(f"Failed to decode log with topic {topic0}: {e}") from e
+        return {"event": self.event_index[topic0]["name"], **args}
+
+
 def get_events_list(address, save_dir="data/events", abi_dir="data/abi"):
     """
-    Get all events and its signature for a contract using web3 library, totally off-chain decoding process.
+    Get all events and its signature for a contract from its ABI, totally off-chain decoding process.
     """
     if not os.path.exists(save_dir):
         os.makedirs(save_dir, exist_ok=True)
 
-    w3 = Web3()
-
     # Load the main contract ABI
-    with open(f"{abi_dir}/{address}.json", "r") as f:
-        main_abi = json.load(f)
+    main_abi = load_abi(f"{abi_dir}/{address}.json")
 
     # Check if this contract has an implementation (proxy pattern)
-    combined_abi = main_abi.copy()  # Start with main ABI
+    combined_abi = main_abi  # Start with main ABI
 
     try:
         implementation_df = pd.read_csv(f"{abi_dir}/implementation.csv")
@@ -37,8 +252,7 @@ def get_events_list(address, save_dir="data/events", abi_dir="data/abi"):
         if implementation_address:
             implementation_abi_path = f"{abi_dir}/{implementation_address}.json"
             if os.path.exists(implementation_abi_path):
-                with open(implementation_abi_path, "r") as f:
-                    implementation_abi = json.load(f)
+                implementation_abi = load_abi(implementation_abi_path)
 
                 # This ensures proxy events are available while adding implementation events
                 combined_abi = main_abi + implementation_abi
@@ -54,20 +268,18 @@ def get_events_list(address, save_dir="data/events", abi_dir="data/abi"):
     except Exception as e:
         logger.info(f"Error loading implementation ABI: {e}")
 
-    contract = w3.eth.contract(address=address, abi=combined_abi)
-
-    all_events = contract.all_events()
+    event_index = build_event_index(combined_abi)
 
     # Collect event data into a list
     event_data = []
-    for event in all_events:
+    for topic, event_abi in event_index.items():
         event_data.append(
             {
-                "name": event.name,
-                "topic": event.topic,
-                "signature": event.signature,
+                "name": event_abi["name"],
+                "topic": topic,
+                "signature": event_signature(event_abi),
                 "address": address,  # put all in address, not implementation address
-                "abi": event.abi,
+                "abi": event_abi,
             }
         )
     df = pd.DataFrame(event_data)
@@ -37,6 +37,7 @@ class PostgresClient:
         self.user = user
         self.password = password
         self._engine = None
+        self._dlt_destination = None
 
     @classmethod
     def from_env(cls) -> "PostgresClient":
@@ -64,8 +65,10 @@ class PostgresClient:
         return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
     def get_dlt_destination(self) -> Any:
-        """Return DLT destination for pipeline operations."""
-        return dlt.destinations.postgres(self.get_connection_url())
+        """Return DLT destination for pipeline operations (cached)."""
+        if self._dlt_destination is None:
+            self._dlt_destination = dlt.destinations.postgres(self.get_connection_url())
+        return self._dlt_destination
 
     @contextmanager
     def get_connection(self):
@@ -89,6 +92,15 @@ class PostgresClient:
             if conn:
                 conn.close()
 
+    @contextmanager
+    def _use_connection(self, conn=None):
+        """Yield the caller's connection if given, otherwise a new short-lived one."""
+        if conn is not None:
+            yield conn
+        else:
+            with self.get_connection() as new_conn:
+                yield new_conn
+
     @property
     def sqlalchemy_engine(self):
         """
@@ -98,72 +110,88 @@ class PostgresClient:
             sqlalchemy.engine.Engine: SQLAlchemy engine
         """
         if self._engine is None:
-            params = self.get_connection_params()
-            connection_string = f"postgresql://{params['user']}:{params['password']}@{params['host']}:{params['port']}/{params['database']}"
-            self._engine = create_engine(connection_string)
+            self._engine = create_engine(self.get_connection_url())
         return self._engine
 
-    def fetch_one(self, query: str, params: Optional[tuple] = None) -> Any:
+    def fetch_one(self, query: str, params: Optional[tuple] = None, conn=None) -> Any:
         """
         Execute a query and return the first result.
 
         Args:
             query: SQL query string
             params: Query parameters (optional)
+            conn: Open connection to run on, e.g. to share one transaction across
+                calls (optional, a new connection is opened if None). Errors on
+                a given connection are raised instead of returning None, so the
+                caller can roll back the aborted transaction.
 
         Returns:
             Query result (fetchone())
         """
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
+            with self._use_connection(conn) as connection:
+                cursor = connection.cursor()
                 cursor.execute(query, params)
                 result = cursor.fetchone()
                 cursor.close()
                 return result
         except Exception as e:
+            # A failed statement aborts the caller's transaction; let them roll back
+            if conn is not None:
+                raise
             logger.warning(f"Failed to query {query} with error {e}, returning None")
             return None
 
-    def fetch_all(self, query: str, params: Optional[tuple] = None) -> list:
+    def fetch_all(self, query: str, params: Optional[tuple] = None, conn=None) -> list:
         """
         Execute a query and return all results.
 
         Args:
             query: SQL query string
             params: Query parameters (optional)
+            conn: Open connection to run on (optional, a new connection is opened if None)
 
         Returns:
             List of query results (fetchall())
         """
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+        with self._use_connection(conn) as connection:
+            cursor = connection.cursor()
             cursor.execute(query, params)
             result = cursor.fetchall()
             cursor.close()
             return result
 
-    def execute(self, query: str, params: Optional[tuple] = None) -> None:
+    def execute(self, query: str, params: Optional[tuple] = None, conn=None) -> None:
         """
         Execute a query without returning results (INSERT, UPDATE, DELETE).
 
         Args:
             query: SQL query string
             params: Query parameters (optional)
+            conn: Open connection to run on (optional). The caller owns the
+                transaction and commits it; if None, a new connection is opened
+                and the statement committed immediately.
         """
+        if conn is not None:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            cursor.close()
+            return
+
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(query, params)
             conn.commit()
             cursor.close()
 
-    def table_exists(self, table_schema: str, table_name: str) -> bool:
+    def table_exists(self, table_schema: str, table_name: str, conn=None) -> bool:
         """
         Check if a table exists in the database.
 
         Args:
             table_schema: Schema name
             table_name: Table name
+            conn: Open connection to run on (optional)
 
         Returns:
             True if table exists, False otherwise
@@ -174,28 +202,33 @@ class PostgresClient:
             WHERE table_schema = %s AND table_name = %s
         )
         """
-        result = self.fetch_one(query, (table_schema, table_name))
+        result = self.fetch_one(query, (table_schema, table_name), conn=conn)
         return result[0] if result else False
 
-    def get_table_row_count(self, table_schema: str, table_name: str) -> int:
+    def get_table_row_count(
+        self, table_schema: str, table_name: str, conn=None
+    ) -> int:
         """
         Get the row count for a specific table.
 
         Args:
             table_schema: Schema name
             table_name: Table name
+            conn: Open connection to run on (optional)
 
         Returns:
             Number of rows in the table, or 0 if table doesn't exist
         """
         try:
-            if not self.table_exists(table_schema, table_name):
+            if not self.table_exists(table_schema, table_name, conn=conn):
                 return 0
 
             query = f"SELECT COUNT(*) FROM {table_schema}.{table_name}"
-            result = self.fetch_one(query)
+            result = self.fetch_one(query, conn=conn)
             return result[0] if result else 0
         except Exception as e:
+            if conn is not None:
+                raise
             logger.warning(
                 f"Error getting row count for {table_schema}.{table_name}: {e}"
             )
@@ -209,22 +242,46 @@ class PostgresClient:
         address: str,
         address_column_name: str,
         block_column_name: str = "block_number",
+        min_block: int = 0,
+        conn=None,
     ) -> int:
+        """
+        Get the highest loaded block for an address, floored at min_block.
+
+        Passing the contract creation block as min_block gives the resume block in
+        a single round-trip instead of a MAX() query plus a comparison in Python.
+
+        Args:
+            table_schema: Schema name
+            table_name: Table name
+            chainid: Chain ID to filter by
+            address: Contract address to filter by (case-insensitive)
+            address_column_name: Column holding the contract address
+            block_column_name: Column holding the block number (default: "block_number")
+            min_block: Lower bound for the result, e.g. the creation block (default: 0)
+            conn: Open connection to run on (optional). Errors on a given
+                connection are raised instead of falling back to min_block.
+
+        Returns:
+            max(highest loaded block, min_block), or min_block if the query fails
+        """
         address = address.lower()
         try:
             query = f"""
-            SELECT MAX({block_column_name}) 
+            SELECT GREATEST(COALESCE(MAX({block_column_name}), 0), %s)
             FROM {table_schema}.{table_name} 
             WHERE {address_column_name} = %s
             AND chainid = %s
             """
-            result = self.fetch_one(query, (address, chainid))
+            result = self.fetch_one(query, (min_block, address, chainid), conn=conn)
 
             if result and result[0] is not None:
                 return int(result[0])
             else:
-                return 0
+                return min_block
 
         except Exception as e:
+            if conn is not None:
+                raise
             logger.warning(f"No result found querying loaded blocks: {e}")
-            return 0
+            return min_block
@@ -2,27 +2,93 @@
 Helper functions for loading data from Etherscan.
 """
 
+import atexit
 import logging
-import random
 import os
-import csv
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
-from typing import Optional, Any, List, Dict, Literal, Tuple
+from typing import Optional, Any, BinaryIO, Iterator, List, Dict, Literal, Tuple
+import orjson
 import polars as pl
-import pandas as pd
+import pyarrow.parquet as pq
 
 from ..extractor.etherscan import EtherscanClient
 from ..extractor.etherscan import EtherscanExtractor
+from ..extractor.exceptions import ResultWindowError
+from ..extractor.rate_limiter import RateLimitedSession
 from ..utils.chain import get_chainid
 from ..utils.database_client import PostgresClient
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_etherscan_clients: Dict[int, EtherscanClient] = {}
+# Etherscan V2 rate limits are per API key, not per chain
+_sessions_by_api_key: Dict[Optional[str], RateLimitedSession] = {}
+_etherscan_clients_lock = threading.Lock()
+_error_log_lock = threading.Lock()
+# Open append handles to the per-table error files, closed at exit
+_error_files: Dict[str, BinaryIO] = {}
+
+# Ranges overflowing the result window are split in half down to a single
+# block; only a block with more records than the window itself is logged
+_MIN_SPLIT_BLOCKS = 1
+
+# Adaptive chunk sizing aims for this many rows per chunk, below Etherscan's
+# 10,000-record result window, within the block-size bounds
+_RESULT_WINDOW_ROWS = 10_000
+_TARGET_CHUNK_ROWS = 9_500
+_MIN_CHUNK_BLOCKS = 1_000
+_MAX_CHUNK_BLOCKS = 200_000
+
+# Returned when Parquet row-group statistics can't answer a resume lookup
+_STATISTICS_UNAVAILABLE = object()
+
+
+def get_etherscan_client(chainid: int) -> EtherscanClient:
+    """Get the shared EtherscanClient for a chain.
+
+    Concurrent backfills on the same chain reuse one client. Clients for
+    different chains share one rate-limited session per API key, since
+    Etherscan V2 applies its rate limit to the key across all chains.
+    """
+    with _etherscan_clients_lock:
+        if chainid not in _etherscan_clients:
+            client = EtherscanClient(chainid=chainid)
+            client._session = _sessions_by_api_key.setdefault(
+                client.config.api_key, client._session
+            )
+            _etherscan_clients[chainid] = client
+        return _etherscan_clients[chainid]
+
+
+def _error_file_path(table_name: str) -> str:
+    return f"logs/extract_error_{table_name}.jsonl"
+
+
+def _close_error_files() -> None:
+    """Close the open error file handles. Callers must hold _error_log_lock."""
+    for f in _error_files.values():
+        f.close()
+    _error_files.clear()
+
+
+def _close_error_files_at_exit() -> None:
+    with _error_log_lock:
+        _close_error_files()
+
 
-def _log_error_to_csv(
+atexit.register(_close_error_files_at_exit)
+
+
+def _log_error(
     contract_address: str,
     chainid: int,
     table_name: str,
@@ -30,89 +96,181 @@ def _log_error_to_csv(
     to_block: int,
     block_chunk_size: int,
 ):
-    """Immediately log an error to CSV file."""
-    error_file = f"logs/extract_error_{table_name}.csv"
-    os.makedirs("logs", exist_ok=True)
-
-    # CSV headers
-    csv_headers = [
-        "timestamp",
-        "contract_address",
-        "chainid",
-        "from_block",
-        "to_block",
-        "block_chunk_size",
-    ]
-
-    # Check if file exists to determine if we need to write headers
-    file_exists = os.path.exists(error_file)
-
-    # Append error to CSV file immediately
-    with open(error_file, "a", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-
-        # Write headers if this is a new file
-        if not file_exists:
-            writer.writerow(csv_headers)
-
-        timestamp = datetime.now().isoformat()
-
-        writer.writerow(
-            [
-                timestamp,
-                contract_address,
-                chainid,
-                from_block,
-                to_block,
-                block_chunk_size,
-            ]
-        )
+    """Immediately append a failed block range to the table's NDJSON error file.
+
+    Each error is one self-contained JSON line, so recording it never re-reads
+    or rewrites earlier entries. The file stays open for the rest of the run and
+    is flushed after every line, so entries survive a crash.
+    """
+    line = orjson.dumps(
+        {
+            "timestamp": datetime.now().isoformat(),
+            "contract_address": contract_address,
+            "chainid": chainid,
+            "from_block": from_block,
+            "to_block": to_block,
+            "block_chunk_size": block_chunk_size,
+        },
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+    with _error_log_lock:
+        f = _error_files.get(table_name)
+        if f is None:
+            os.makedirs("logs", exist_ok=True)
+            f = _error_files[table_name] = open(_error_file_path(table_name), "ab")
+        f.write(line)
+        f.flush()
 
     logger.warning(
         f"💥 Error {contract_address} - {chainid} - {table_name} - {from_block}-{to_block}"
     )
 
 
-def _get_resume_block(file_path: Path, address: str) -> Optional[int]:
+def _is_result_window_error(error: BaseException) -> bool:
+    """Whether error, or an exception it was raised from, is a ResultWindowError.
+
+    Errors raised inside a dlt resource reach the caller wrapped in dlt's own
+    exception types.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        if isinstance(error, ResultWindowError):
+            return True
+        seen.add(id(error))
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _get_resume_block(
+    file_path: Path, address: str, single_address: bool = False
+) -> Optional[int]:
     """Get the maximum block number from existing parquet file to resume from.
 
+    Results are cached on the file's modification time, so repeated lookups for
+    an unchanged file don't re-read it.
+
     Args:
         file_path: Path to the parquet file
         address: Contract address to filter by
+        single_address: The file only ever holds this address (as with the default
+            {chain}_{address}/{table}.parquet layout), so the address filter can be
+            skipped (default: False)
 
     Returns:
-        Next block number to resume from (max_block + 1), or None if no existing data
+        Maximum block number already extracted for the address, or None if no existing data
     """
-    if not file_path.exists():
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
         return None
+    return _get_resume_block_cached(
+        str(file_path), mtime, None if single_address else address.lower()
+    )
 
-    try:
-        schema = pl.scan_parquet(file_path).collect_schema()
 
-        if "contract_address" in schema:
+@lru_cache(maxsize=1024)
+def _get_resume_block_cached(
+    file_path: str, mtime: float, address: Optional[str]
+) -> Optional[int]:
+    """Find the address's max block in a parquet file. Keyed on mtime.
+
+    The footer's row-group statistics answer this without decoding data pages
+    when every row group either holds only this address or cannot contain it;
+    otherwise the blockNumber column is scanned. An address of None means the
+    file holds a single address and no filtering is needed.
+    """
+    try:
+        try:
+            metadata = pq.read_metadata(file_path)
+            column_names = metadata.schema.to_arrow_schema().names
+        except Exception as e:
+            # e.g. a legacy file with 128-bit integer columns, which pyarrow
+            # can't open; polars can, without the statistics shortcut
+            logger.debug(f"Falling back to a scan of {file_path}: {e}")
+            metadata = None
+            column_names = pl.read_parquet_schema(file_path).keys()
+
+        if address is None:
+            max_block = (
+                _max_block_from_statistics(metadata, None, None)
+                if metadata is not None
+                else _STATISTICS_UNAVAILABLE
+            )
+            if max_block is _STATISTICS_UNAVAILABLE:
+                max_block = (
+                    pl.scan_parquet(file_path)
+                    .select(pl.col("blockNumber").max())
+                    .collect(engine="streaming")
+                    .item()
+                )
+            return max_block or None
+
+        if "contract_address" in column_names:
             # This is a logs file
             address_col = "contract_address"
-        elif "address" in schema:
+        elif "address" in column_names:
             # This is a transactions file
             address_col = "address"
         else:
             logger.error(f"No appropriate address column found in {file_path}")
             return None
 
-        # Use scan_parquet for memory efficiency
         max_block = (
-            pl.scan_parquet(file_path)
-            .filter(pl.col(address_col) == address.lower())
-            .select(pl.col("blockNumber").max())
-            .collect()
-            .item()
+            _max_block_from_statistics(metadata, address_col, address)
+            if metadata is not None
+            else _STATISTICS_UNAVAILABLE
         )
+        if max_block is _STATISTICS_UNAVAILABLE:
+            max_block = (
+                pl.scan_parquet(file_path)
+                .select(address_col, "blockNumber")
+                .filter(pl.col(address_col) == address)
+                .select(pl.col("blockNumber").max())
+                .collect(engine="streaming")
+                .item()
+            )
         return max_block or None
     except Exception as e:
         logger.warning(f"Could not read existing file {file_path}: {e}")
         return None
 
 
+def _max_block_from_statistics(
+    metadata, address_col: Optional[str], address: Optional[str]
+):
+    """Max blockNumber for address from row-group min/max statistics.
+
+    With address_col None, every row group counts. Returns None if no row group
+    holds the address, or _STATISTICS_UNAVAILABLE if a row group lacks
+    statistics or mixes this address with others.
+    """
+    max_block = None
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        if row_group.num_rows == 0:
+            continue
+        stats = {
+            row_group.column(j).path_in_schema: row_group.column(j).statistics
+            for j in range(row_group.num_columns)
+        }
+        block_stats = stats.get("blockNumber")
+        if block_stats is None or not block_stats.has_min_max:
+            return _STATISTICS_UNAVAILABLE
+        if address_col is None:
+            max_block = max(max_block or 0, block_stats.max)
+            continue
+
+        address_stats = stats.get(address_col)
+        if address_stats is None or not address_stats.has_min_max:
+            return _STATISTICS_UNAVAILABLE
+
+        if address_stats.min == address_stats.max == address:
+            max_block = max(max_block or 0, block_stats.max)
+        elif address_stats.min <= address <= address_stats.max:
+            return _STATISTICS_UNAVAILABLE
+    return max_block
+
+
 def _etherscan_to_parquet_in_chunks(
     contract_address: str,
     etherscan_client: EtherscanClient,
@@ -121,6 +279,8 @@ def _etherscan_to_parquet_in_chunks(
     to_block: Optional[int] = None,
     block_chunk_size: int = 50_000,
     table: Literal["logs", "transactions"] = "logs",
+    max_workers: int = 5,
+    adaptive_chunk_size: bool = True,
 ) -> Path:
     """Backfill blockchain data from Etherscan to protocol-grouped Parquet files in chunks.
 
@@ -128,17 +288,30 @@ def _etherscan_to_parquet_in_chunks(
     - logs of a specific contract address
     - transactions to a specific contract address (optional)
 
+    Chunks are fetched concurrently by up to `max_workers` threads sharing the
+    client's rate-limited session. Each chunk is written as its own part file,
+    and the parts are merged into the output Parquet file once at the end, so a
+    chunk write does not rewrite the growing output file.
+    With `adaptive_chunk_size`, the size of the next chunks follows the row
+    density (EMA of rows per block) of the chunks written so far, so dense
+    ranges stay under the API result window and sparse ranges take fewer calls.
+
     Args:
         contract_address: Ethereum contract address to fetch data for (case-insensitive)
         etherscan_client: Configured Etherscan API client for data retrieval
         from_block: Starting block number (uses contract creation block if None)
         to_block: Ending block number (uses latest block if None)
-        block_chunk_size: Number of blocks to process per chunk (default: 50,000)
+        block_chunk_size: Number of blocks to process per chunk, the initial size
+            if adaptive (default: 50,000)
         output_path: Path for parquet file output
         table: Whether to extract event logs or transactions (default: "logs")
+        max_workers: Number of chunks fetched concurrently (default: 5)
+        adaptive_chunk_size: Resize chunks from observed row density (default: True)
     Returns:
         Path to the parquet file
     """
+    if from_block > to_block:
+        return output_path
 
     extractor = EtherscanExtractor(etherscan_client)
     contract_address = contract_address.lower()
@@ -146,39 +319,156 @@ def _etherscan_to_parquet_in_chunks(
     chain = etherscan_client.chain
 
     end_block = to_block
-
-    for chunk_start in range(from_block, end_block + 1, block_chunk_size):
-        chunk_end = min(chunk_start + block_chunk_size - 1, end_block)
-
+    chunk_size = block_chunk_size
+    ema_rows_per_block = None
+
+    def _fetch_with_retries(chunk_start: int, chunk_end: int) -> List[Dict[str, Any]]:
+        """Fetch a block range, retrying failures with exponential backoff.
+
+        Etherscan reports rate limiting (and other transient errors) as HTTP 200
+        responses, which the session's adapter doesn't retry. Result window
+        errors are raised at once, since only a smaller range can fix them.
+        """
+        retry_attempts = etherscan_client.config.retry_attempts
+        for attempt in range(retry_attempts):
+            try:
+                return extractor.fetch(
+                    address=contract_address,
+                    chain=chain,
+                    table=table,
+                    from_block=chunk_start,
+                    to_block=chunk_end,
+                    offset=1000,
+                )
+            except Exception as e:
+                if _is_result_window_error(e) or attempt == retry_attempts - 1:
+                    raise
+                # Jitter spreads out retries from threads that failed together
+                delay = min(
+                    etherscan_client.config.retry_delay_base * (2**attempt)
+                    + random.random(),
+                    60,
+                )
+                logger.warning(
+                    f"Fetching {table} blocks {chunk_start}-{chunk_end} of {contract_address} failed "
+                    f"(attempt {attempt + 1}): {e}. Retrying in {delay:.1f}s..."
+                )
+                time.sleep(delay)
+
+    def _fetch_chunk(
+        chunk_start: int, chunk_end: int
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[int, int]]]:
+        """Fetch a block range, splitting it while it overflows the result window.
+
+        Returns:
+            Records of the ranges that were fetched, and the (from, to) ranges
+            that failed
+        """
         try:
-            extractor.to_parquet(
-                address=contract_address,
-                chain=chain,
-                table=table,
-                from_block=chunk_start,
-                to_block=chunk_end,
-                offset=1000,
-                output_path=output_path,
+            return _fetch_with_retries(chunk_start, chunk_end), []
+        except Exception as e:
+            # Only a range with too many records for the result window is worth
+            # splitting; any other error would fail the same way for every half.
+            if (
+                not _is_result_window_error(e)
+                or chunk_end - chunk_start + 1 <= _MIN_SPLIT_BLOCKS
+            ):
+                logger.error(
+                    f"Failed to extract {table} for blocks {chunk_start} to {chunk_end} with error {e}"
+                )
+                return [], [(chunk_start, chunk_end)]
+            mid = (chunk_start + chunk_end) // 2
+            logger.debug(
+                f"Splitting {table} blocks {chunk_start}-{chunk_end} of {contract_address}: {e}"
             )
+            left_data, left_failed = _fetch_chunk(chunk_start, mid)
+            right_data, right_failed = _fetch_chunk(mid + 1, chunk_end)
+            return left_data + right_data, left_failed + right_failed
 
+    def _write_chunk(chunk_idx: int, chunk_start: int, chunk_end: int, future) -> None:
+        nonlocal chunk_size, ema_rows_per_block
+        try:
+            data, failed_ranges = future.result()
+            # Sub-ranges that were fetched are kept; only failed ones are logged
+            rows_written = extractor.write_part(
+                data, output_path, chunk_start, chunk_end
+            )
         except Exception as e:
             logger.error(
-                f"Failed to extract {table} for blocks {chunk_start} to {chunk_end} with error {e}"
+                f"Failed to write {table} for blocks {chunk_start} to {chunk_end} with error {e}"
             )
-            # Immediately log error to CSV
-            _log_error_to_csv(
+            failed_ranges = [(chunk_start, chunk_end)]
+            rows_written = None
+
+        for failed_start, failed_end in failed_ranges:
+            # Immediately log error to file
+            _log_error(
                 contract_address=contract_address,
                 chainid=chainid,
                 table_name=table,
-                from_block=chunk_start,
-                to_block=chunk_end,
-                block_chunk_size=block_chunk_size,
+                from_block=failed_start,
+                to_block=failed_end,
+                block_chunk_size=failed_end - failed_start + 1,
             )
+        if rows_written is None:
+            return
 
-    if os.path.exists(output_path):
-        total_extracted = pl.scan_parquet(output_path).select(pl.len()).collect().item()
-    else:
-        total_extracted = 0
+        fetched_blocks = (chunk_end - chunk_start + 1) - sum(
+            failed_end - failed_start + 1 for failed_start, failed_end in failed_ranges
+        )
+        if adaptive_chunk_size and fetched_blocks > 0:
+            rows_per_block = len(data) / fetched_blocks
+            ema_rows_per_block = (
+                rows_per_block
+                if ema_rows_per_block is None
+                else 0.7 * ema_rows_per_block + 0.3 * rows_per_block
+            )
+            chunk_size = int(
+                min(
+                    max(
+                        _TARGET_CHUNK_ROWS / max(ema_rows_per_block, 1e-6),
+                        _MIN_CHUNK_BLOCKS,
+                    ),
+                    _MAX_CHUNK_BLOCKS,
+                )
+            )
+            if len(data) >= _RESULT_WINDOW_ROWS:
+                # The chunk overflowed the result window and had to be split;
+                # don't wait for the EMA to catch up before shrinking
+                chunk_size = max(
+                    min(chunk_size, (chunk_end - chunk_start + 1) // 2),
+                    _MIN_CHUNK_BLOCKS,
+                )
+        if chunk_idx % 10 == 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"{contract_address} - {table} - chunk {chunk_idx}: {chunk_start}-{chunk_end}, {rows_written} rows"
+            )
+
+    # Keep a bounded window of in-flight chunks so fetched pages don't pile up in memory
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        chunk_idx = 0
+        chunk_start = from_block
+        while chunk_start <= end_block:
+            # chunk_size is updated as earlier chunks are written
+            chunk_end = min(chunk_start + chunk_size - 1, end_block)
+            pending.append(
+                (
+                    chunk_idx,
+                    chunk_start,
+                    chunk_end,
+                    executor.submit(_fetch_chunk, chunk_start, chunk_end),
+                )
+            )
+            chunk_idx += 1
+            chunk_start = chunk_end + 1
+            if len(pending) >= 2 * max_workers:
+                _write_chunk(*pending.popleft())
+
+        while pending:
+            _write_chunk(*pending.popleft())
+
+    total_extracted = extractor.compact_parts(output_path)
 
     logger.info(
         f"✅ {contract_address} - {chainid} - {table} - {from_block}-{to_block}, {total_extracted}"
@@ -189,11 +479,12 @@ def _etherscan_to_parquet_in_chunks(
 def etherscan_to_parquet(
     address: str,
     chain: str,
-    output_path: Path,
+    output_path: Optional[Path] = None,
     from_block: Optional[int] = None,
     to_block: Optional[int] = None,
     table: Literal["logs", "transactions"] = "logs",
     block_chunk_size: int = 20_000,
+    min_new_blocks: int = 1,
 ) -> Path:
     """Extract historical data for a contract and save to Parquet files.
 
@@ -201,21 +492,43 @@ def etherscan_to_parquet(
         address: Contract address to extract data for
         chain: Chain name (e.g. "ethereum", "polygon")
         output_path: Path for parquet file output
+            (default: {PARQUET_DATA_DIR}/{chain}_{address}/{table}.parquet)
         from_block: Starting block number
         to_block: Ending block number
         table: Whether to extract event logs or transactions (default: "logs")
         block_chunk_size: Number of blocks to process per chunk (default: 50,000)
+        min_new_blocks: Skip the contract when the existing file is fewer than
+            this many blocks behind to_block (default: 1, i.e. skip only when
+            the file already reaches to_block)
     Returns:
         Path to the parquet file
     """
     chainid = get_chainid(chain)
-    etherscan_client = EtherscanClient(chainid=chainid)
-    from_block = from_block or etherscan_client.get_contract_creation_block_number(
-        address
+    etherscan_client = get_etherscan_client(chainid)
+    extractor = EtherscanExtractor(etherscan_client)
+    # Files in the default layout only ever hold this one address
+    single_address = output_path is None
+    if output_path is None:
+        output_path = extractor.get_output_path(address.lower(), chain, table)
+    # Merge parts left behind by an interrupted run before resuming from the file
+    extractor.compact_parts(output_path)
+    # Resume from existing data first; only look up the creation block when needed
+    resume_block = _get_resume_block(
+        Path(output_path), address, single_address=single_address
+    )
+    from_block = (
+        resume_block
+        or from_block
+        or etherscan_client.get_contract_creation_block_number(address)
     )
-    if output_path.exists():
-        from_block = _get_resume_block(Path(output_path), address)
     to_block = to_block or etherscan_client.get_latest_block()
+    if from_block > to_block or (
+        resume_block is not None and to_block - resume_block < min_new_blocks
+    ):
+        logger.info(
+            f"⏭️ {address} - {chainid} - {table} already up to date at block {to_block}"
+        )
+        return output_path
 
     # Extract to Parquet files
     _etherscan_to_parquet_in_chunks(
@@ -230,38 +543,49 @@ def etherscan_to_parquet(
     return output_path
 
 
-def find_error_file(table_name: str) -> str:
-    """Find the CSV error file for given address and chainid."""
-    error_file = f"logs/extract_error_{table_name}.csv"
-    if not Path(error_file).exists():
-        raise FileNotFoundError(f"No error file found for {table_name}")
-    return error_file
+def read_errors(error_file: str) -> Iterator[Dict[str, Any]]:
+    """Stream the failed block ranges recorded in an NDJSON error file."""
+    with open(error_file, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
 
 
-def retry_failed_blocks(table_name: Literal["logs", "transactions"]) -> Tuple[str, str]:
-    """Retry failed block ranges with smaller chunk size."""
-    error_file = find_error_file(table_name)
+def retry_failed_blocks(table_name: Literal["logs", "transactions"]) -> Optional[Path]:
+    """Retry failed block ranges with smaller chunk size.
 
-    df = pd.read_csv(error_file)
-    resolved_error_file = error_file.replace(".csv", "_resolved.csv")
-    df.to_csv(resolved_error_file, index=False)
-    os.remove(error_file)
-
-    for _, row in df.iterrows():
-        chainid = row.chainid
-        etherscan_client = EtherscanClient(chainid=chainid)
-        address = row.contract_address
+    Retried rows fill gaps below blocks that may already be loaded into Postgres;
+    load them with a primary_key, or with reload_from_block set to the lowest
+    retried block (see `load_parquet_to_postgres`).
+    """
+    error_file = _error_file_path(table_name)
+    resolved_error_file = error_file.replace(".jsonl", "_resolved.jsonl")
+    # Moving the file is the existence check, so a concurrent writer can't
+    # slip an entry in between a check and the move. Open handles are closed
+    # first so errors from this retry go to a fresh error file.
+    with _error_log_lock:
+        _close_error_files()
+        try:
+            os.replace(error_file, resolved_error_file)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No error file found for {table_name}")
 
-        from_block = row.from_block
-        to_block = row.to_block
-        block_chunk_size = max(int(row.block_chunk_size / 10), 1000)
+    output_path = None
+    for error in read_errors(resolved_error_file):
+        etherscan_client = get_etherscan_client(error["chainid"])
+        address = error["contract_address"]
+        block_chunk_size = max(error["block_chunk_size"] // 10, 1)
 
-        logs_output_path = _etherscan_to_parquet_in_chunks(
+        output_path = _etherscan_to_parquet_in_chunks(
             contract_address=address,
             etherscan_client=etherscan_client,
-            from_block=from_block,
-            to_block=to_block,
+            output_path=EtherscanExtractor(etherscan_client).get_output_path(
+                address, etherscan_client.chain, table_name
+            ),
+            from_block=error["from_block"],
+            to_block=error["to_block"],
             block_chunk_size=block_chunk_size,
             table=table_name,
+            adaptive_chunk_size=False,
         )
-    return logs_output_path
+    return output_path
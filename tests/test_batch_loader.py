@@ -0,0 +1,188 @@
+import csv
+import io
+from contextlib import contextmanager
+
+import polars as pl
+import pytest
+
+from onchaindata.loader.batch_loader import (
+    PostgresCopyWriter,
+    _block_aligned_batches,
+    load_parquet_to_postgres,
+)
+from onchaindata.utils.database_client import PostgresClient
+
+
+ADDRESS = "0x" + "ab" * 20
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rowcount = -1
+        self._result = None
+
+    def execute(self, query, params=None):
+        query = " ".join(query.split())
+        self.db.statements.append(query)
+        if query.startswith("SELECT block_number FROM"):
+            table_name, chainid, address = params
+            block = self.db.watermarks.get((table_name, chainid, address))
+            self._result = (block,) if block is not None else None
+        elif query.startswith("INSERT INTO") and "_load_watermarks" in query:
+            table_name, chainid, address, block = params
+            self.db.watermarks[(table_name, chainid, address)] = block
+        elif query.startswith("DELETE FROM"):
+            chainid, address, block = params
+            kept = [row for row in self.db.rows if int(row["block_number"]) < block]
+            self.rowcount = len(self.db.rows) - len(kept)
+            self.db.rows = kept
+
+    def copy_expert(self, sql, buffer, size=None):
+        columns = sql[sql.index("(") + 1 : sql.index(")")].replace('"', "").split(", ")
+        text = io.TextIOWrapper(buffer, encoding="utf-8")
+        rows = [dict(zip(columns, values)) for values in csv.reader(text)]
+        text.detach()
+        self.db.rows.extend(rows)
+        self.rowcount = len(rows)
+
+    def fetchone(self):
+        return self._result
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+        self.watermarks = {}
+        self.rows = []
+        self.commits = 0
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+
+class FakePostgresClient(PostgresClient):
+    def __init__(self, conn):
+        super().__init__()
+        self.conn = conn
+
+    @contextmanager
+    def get_connection(self):
+        yield self.conn
+
+
+def _write_logs(path, blocks):
+    pl.DataFrame(
+        {
+            "blockNumber": blocks,
+            "logIndex": list(range(len(blocks))),
+            "chainid": [1] * len(blocks),
+            "contract_address": [ADDRESS] * len(blocks),
+            "topics": [["0x01", "0x02"]] * len(blocks),
+        }
+    ).write_parquet(path)
+
+
+def test_block_aligned_batches_carries_last_block():
+    frames = [
+        pl.DataFrame({"block_number": [1, 2, 2]}),
+        pl.DataFrame({"block_number": [2, 3]}),
+        pl.DataFrame({"block_number": [4]}),
+    ]
+
+    batches = [b["block_number"].to_list() for b in _block_aligned_batches(frames)]
+
+    assert batches == [[1], [2, 2, 2], [3], [4]]
+
+
+def test_block_aligned_batches_rejects_unsorted_input():
+    frames = [pl.DataFrame({"block_number": [3, 1]})]
+
+    with pytest.raises(ValueError, match="not sorted"):
+        list(_block_aligned_batches(frames))
+
+
+def test_block_aligned_batches_skips_empty_frames():
+    frames = [
+        pl.DataFrame({"block_number": []}, schema={"block_number": pl.Int64}),
+        pl.DataFrame({"block_number": [5, 5]}),
+    ]
+
+    batches = [b["block_number"].to_list() for b in _block_aligned_batches(frames)]
+
+    assert batches == [[5, 5]]
+
+
+def test_encode_json_columns():
+    df = pl.DataFrame({"topics": [["0x01", "0x02"], []], "data": ["0x", "0x"]})
+
+    encoded = PostgresCopyWriter._encode_json_columns(df)
+
+    assert encoded["topics"].to_list() == ['["0x01","0x02"]', "[]"]
+    assert encoded["data"].to_list() == ["0x", "0x"]
+
+
+def test_load_resumes_after_watermark(tmp_path):
+    path = tmp_path / "logs.parquet"
+    _write_logs(path, [10, 11, 12, 13])
+    conn = FakeConnection()
+    conn.watermarks[("logs", 1, ADDRESS)] = 11
+
+    rows_loaded = load_parquet_to_postgres(path, FakePostgresClient(conn))
+
+    assert rows_loaded == 2
+    assert [row["block_number"] for row in conn.rows] == ["12", "13"]
+    assert [row["topics"] for row in conn.rows] == ['["0x01","0x02"]'] * 2
+    assert conn.watermarks[("logs", 1, ADDRESS)] == 13
+
+
+def test_load_with_primary_key_ignores_watermark(tmp_path):
+    path = tmp_path / "logs.parquet"
+    _write_logs(path, [10, 11, 12])
+    conn = FakeConnection()
+    conn.watermarks[("logs", 1, ADDRESS)] = 12
+
+    load_parquet_to_postgres(
+        path,
+        FakePostgresClient(conn),
+        primary_key=("chainid", "block_number", "log_index"),
+    )
+
+    assert [row["block_number"] for row in conn.rows] == ["10", "11", "12"]
+    assert any("ON CONFLICT" in q and "DO NOTHING" in q for q in conn.statements)
+
+
+def test_load_reload_from_block(tmp_path):
+    path = tmp_path / "logs.parquet"
+    _write_logs(path, [10, 11, 12])
+    conn = FakeConnection()
+    conn.rows = [{"block_number": "10"}, {"block_number": "12"}]
+    conn.watermarks[("logs", 1, ADDRESS)] = 12
+
+    rows_loaded = load_parquet_to_postgres(
+        path, FakePostgresClient(conn), reload_from_block=11
+    )
+
+    assert rows_loaded == 2
+    assert [row["block_number"] for row in conn.rows] == ["10", "11", "12"]
+    assert conn.watermarks[("logs", 1, ADDRESS)] == 12
+
+
+def test_load_sorts_unsorted_file(tmp_path):
+    # Files extracted before outputs were sorted by block
+    path = tmp_path / "logs.parquet"
+    _write_logs(path, [12, 10, 13, 11])
+    conn = FakeConnection()
+
+    rows_loaded = load_parquet_to_postgres(path, FakePostgresClient(conn))
+
+    assert rows_loaded == 4
+    assert [row["block_number"] for row in conn.rows] == ["10", "11", "12", "13"]
+    assert pl.read_parquet(path)["blockNumber"].to_list() == [10, 11, 12, 13]
+    assert conn.watermarks[("logs", 1, ADDRESS)] == 13
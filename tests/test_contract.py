@@ -0,0 +1,237 @@
+import pytest
+from eth_abi import decode, encode
+from eth_hash.auto import keccak
+
+from onchaindata.extractor.exceptions import DecodingError
+from onchaindata.utils.contract import (
+    EventLogDecoder,
+    build_specialized_decoder,
+    event_signature,
+    event_topic,
+)
+
+
+ALICE = "0x" + "ab" * 20
+BOB = "0x" + "cd" * 20
+
+
+def _event(name, *inputs):
+    return {
+        "type": "event",
+        "name": name,
+        "inputs": [
+            {"name": input_name, "type": abi_type, "indexed": indexed}
+            for input_name, abi_type, indexed in inputs
+        ],
+    }
+
+
+def _topic(abi_type, value):
+    return "0x" + encode([abi_type], [value]).hex()
+
+
+def _normalize(abi_type, value):
+    """eth_abi's output in the decoder's representation."""
+    if abi_type == "address":
+        return value.lower()
+    if abi_type.startswith("bytes"):
+        return "0x" + value.hex()
+    return value
+
+
+def _expected(event_abi, values):
+    """Decode data values with eth_abi for comparison with the generated decoder."""
+    data_inputs = [p for p in event_abi["inputs"] if not p["indexed"]]
+    types = [p["type"] for p in data_inputs]
+    decoded = decode(types, encode(types, values))
+    return {
+        p["name"]: _normalize(p["type"], value)
+        for p, value in zip(data_inputs, decoded)
+    }
+
+
+def test_event_signature():
+    transfer = _event(
+        "Transfer",
+        ("from", "address", True),
+        ("to", "address", True),
+        ("value", "uint256", False),
+    )
+
+    assert event_signature(transfer) == "Transfer(address,address,uint256)"
+    assert event_topic(event_signature(transfer)) == (
+        "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+    )
+
+
+def test_static_data_matches_eth_abi():
+    event_abi = _event(
+        "Static",
+        ("amount", "uint256", False),
+        ("small", "uint8", False),
+        ("delta", "int256", False),
+        ("tick", "int24", False),
+        ("flag", "bool", False),
+        ("selector", "bytes4", False),
+        ("owner", "address", False),
+    )
+    values = [2**200, 255, -(2**100), -887272, True, b"\x12\x34\x56\x78", ALICE]
+    types = [p["type"] for p in event_abi["inputs"]]
+
+    decoded = build_specialized_decoder(event_abi)(
+        [event_topic(event_signature(event_abi))], encode(types, values)
+    )
+
+    assert decoded == _expected(event_abi, values)
+    assert decoded["selector"] == "0x12345678"
+
+
+def test_dynamic_data_matches_eth_abi():
+    event_abi = _event(
+        "Dynamic",
+        ("owner", "address", False),
+        ("name", "string", False),
+        ("payload", "bytes", False),
+        ("amounts", "uint256[]", False),
+        ("delta", "int128", False),
+        ("salt", "bytes32", False),
+    )
+    values = [BOB, "hello", b"\x00\x01\x02", [1, 2**255], -5, b"\x11" * 32]
+    types = [p["type"] for p in event_abi["inputs"]]
+
+    decoded = build_specialized_decoder(event_abi)(
+        [event_topic(event_signature(event_abi))], encode(types, values)
+    )
+
+    assert decoded == _expected(event_abi, values)
+    assert decoded["owner"] == BOB
+    assert decoded["payload"] == "0x000102"
+
+
+def test_indexed_topics():
+    event_abi = _event(
+        "Indexed",
+        ("owner", "address", True),
+        ("delta", "int256", True),
+        ("selector", "bytes4", True),
+        ("amount", "uint256", False),
+    )
+    topics = [
+        event_topic(event_signature(event_abi)),
+        _topic("address", ALICE),
+        _topic("int256", -42),
+        _topic("bytes4", b"\x12\x34\x56\x78"),
+    ]
+
+    decoded = build_specialized_decoder(event_abi)(topics, encode(["uint256"], [7]))
+
+    assert decoded == {
+        "owner": ALICE,
+        "delta": -42,
+        "selector": "0x12345678",
+        "amount": 7,
+    }
+
+
+def test_indexed_bool_uint_and_dynamic_hash():
+    event_abi = _event(
+        "Hashed",
+        ("flag", "bool", True),
+        ("id", "uint256", True),
+        ("name", "string", True),
+    )
+    name_hash = "0x" + keccak(b"hello").hex()
+    topics = [
+        event_topic(event_signature(event_abi)),
+        _topic("bool", True),
+        _topic("uint256", 2**255),
+        name_hash,
+    ]
+
+    decoded = build_specialized_decoder(event_abi)(topics, b"")
+
+    assert decoded == {"flag": True, "id": 2**255, "name": name_hash}
+
+
+def test_decoder_decodes_logs_by_topic0():
+    transfer = _event(
+        "Transfer",
+        ("from", "address", True),
+        ("to", "address", True),
+        ("value", "uint256", False),
+    )
+    decoder = EventLogDecoder([transfer])
+    log = {
+        "topics": [
+            event_topic(event_signature(transfer)),
+            _topic("address", ALICE),
+            _topic("address", BOB),
+        ],
+        "data": "0x" + encode(["uint256"], [10**18]).hex(),
+    }
+
+    assert decoder.decode(log) == {
+        "event": "Transfer",
+        "from": ALICE,
+        "to": BOB,
+        "value": 10**18,
+    }
+    assert decoder.decode({"topics": ["0x" + "00" * 32], "data": "0x"}) is None
+
+
+@pytest.mark.parametrize("data", ["0x", "0x" + "00" * 31])
+def test_truncated_static_data_raises(data):
+    transfer = _event(
+        "Transfer",
+        ("from", "address", True),
+        ("to", "address", True),
+        ("value", "uint256", False),
+    )
+    decoder = EventLogDecoder([transfer])
+    log = {
+        "topics": [
+            event_topic(event_signature(transfer)),
+            _topic("address", ALICE),
+            _topic("address", BOB),
+        ],
+        "data": data,
+    }
+
+    with pytest.raises(DecodingError):
+        decoder.decode(log)
+
+
+def test_truncated_dynamic_data_raises():
+    event_abi = _event("Named", ("name", "string", False))
+    decoder = EventLogDecoder([event_abi])
+    data = encode(["string"], ["hello"])[:40]
+    log = {"topics": [event_topic(event_signature(event_abi))], "data": "0x" + data.hex()}
+
+    with pytest.raises(DecodingError):
+        decoder.decode(log)
+
+
+def test_indexed_arrays_are_returned_as_hashes():
+    event_abi = _event(
+        "Arrays",
+        ("ids", "uint256[]", True),
+        ("deltas", "int8[2]", True),
+    )
+    ids_hash = "0x" + keccak(encode(["uint256[]"], [[1, 2]])).hex()
+    deltas_hash = "0x" + keccak(b"\x01" * 64).hex()
+    topics = [event_topic(event_signature(event_abi)), ids_hash, deltas_hash]
+
+    decoded = build_specialized_decoder(event_abi)(topics, b"")
+
+    assert decoded == {"ids": ids_hash, "deltas": deltas_hash}
+
+
+def test_input_named_event_does_not_replace_event_name():
+    event_abi = _event("Emitted", ("event", "uint256", False))
+    decoder = EventLogDecoder([event_abi])
+    log = {
+        "topics": [event_topic(event_signature(event_abi))],
+        "data": "0x" + encode(["uint256"], [3]).hex(),
+    }
+
+    assert decoder.decode(log) == {"event": "Emitted", "event_": 3}
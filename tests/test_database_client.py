@@ -0,0 +1,34 @@
+import pytest
+
+from onchaindata.utils.database_client import PostgresClient
+
+
+class FailingCursor:
+    def execute(self, query, params=None):
+        raise RuntimeError("current transaction is aborted")
+
+    def close(self):
+        pass
+
+
+class FailingConnection:
+    def cursor(self):
+        return FailingCursor()
+
+
+def test_fetch_one_raises_on_caller_connection():
+    with pytest.raises(RuntimeError):
+        PostgresClient().fetch_one("SELECT 1", conn=FailingConnection())
+
+
+def test_get_max_loaded_block_raises_on_caller_connection():
+    with pytest.raises(RuntimeError):
+        PostgresClient().get_max_loaded_block(
+            "etherscan_raw",
+            "logs",
+            chainid=1,
+            address="0xAB",
+            address_column_name="contract_address",
+            min_block=100,
+            conn=FailingConnection(),
+        )
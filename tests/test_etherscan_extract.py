@@ -0,0 +1,124 @@
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+
+from onchaindata.extractor.etherscan import EtherscanExtractor
+from onchaindata.extractor.exceptions import APIError, ResultWindowError
+from onchaindata.utils import etherscan_extract
+from onchaindata.utils.etherscan_extract import (
+    _etherscan_to_parquet_in_chunks,
+    read_errors,
+)
+
+
+ADDRESS = "0x" + "ab" * 20
+CLIENT = SimpleNamespace(
+    chainid=1,
+    chain="ethereum",
+    config=SimpleNamespace(retry_attempts=3, retry_delay_base=1.0),
+)
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(etherscan_extract.time, "sleep", lambda seconds: None)
+    yield tmp_path
+    with etherscan_extract._error_log_lock:
+        etherscan_extract._close_error_files()
+
+
+def _fake_fetch(monkeypatch, fail):
+    """Patch EtherscanExtractor.fetch to return one record per 100 blocks,
+    raising fail(from_block, to_block) when it returns an exception."""
+    calls = []
+
+    def fetch(self, address, chain, table, from_block, to_block, offset):
+        calls.append((from_block, to_block))
+        error = fail(from_block, to_block)
+        if error is not None:
+            raise error
+        first = -(-from_block // 100) * 100
+        return [
+            {"blockNumber": block, "logIndex": 0, "contract_address": address}
+            for block in range(first, to_block + 1, 100)
+        ]
+
+    monkeypatch.setattr(EtherscanExtractor, "fetch", fetch)
+    return calls
+
+
+def _run(output_path, from_block, to_block, block_chunk_size):
+    _etherscan_to_parquet_in_chunks(
+        contract_address=ADDRESS,
+        etherscan_client=CLIENT,
+        output_path=output_path,
+        from_block=from_block,
+        to_block=to_block,
+        block_chunk_size=block_chunk_size,
+        max_workers=1,
+        adaptive_chunk_size=False,
+    )
+
+
+def test_result_window_split_keeps_fetched_halves(workdir, monkeypatch):
+    def fail(from_block, to_block):
+        # Block 12,300 alone holds more records than the result window
+        if to_block - from_block + 1 > 5_000 or from_block <= 12_300 <= to_block:
+            return ResultWindowError("Result window is too large")
+        return None
+
+    calls = _fake_fetch(monkeypatch, fail)
+    output_path = workdir / "logs.parquet"
+
+    _run(output_path, 0, 19_999, 20_000)
+
+    errors = list(read_errors("logs/extract_error_logs.jsonl"))
+    assert [(e["from_block"], e["to_block"]) for e in errors] == [(12_300, 12_300)]
+    blocks = pl.read_parquet(output_path)["blockNumber"].to_list()
+    assert blocks == [b for b in range(0, 20_000, 100) if b != 12_300]
+    assert len(calls) < 50
+
+
+def test_transient_errors_are_retried(workdir, monkeypatch):
+    failures = iter([APIError("Rate limit exceeded"), APIError("Query Timeout")])
+    calls = _fake_fetch(monkeypatch, lambda f, t: next(failures, None))
+    output_path = workdir / "logs.parquet"
+
+    _run(output_path, 0, 999, 1_000)
+
+    assert calls == [(0, 999)] * 3
+    assert pl.read_parquet(output_path).height == 10
+    assert not (workdir / "logs" / "extract_error_logs.jsonl").exists()
+
+
+def test_other_errors_are_retried_but_not_split(workdir, monkeypatch):
+    calls = _fake_fetch(monkeypatch, lambda f, t: APIError("Invalid API Key"))
+
+    _run(workdir / "logs.parquet", 0, 49_999, 50_000)
+
+    assert calls == [(0, 49_999)] * CLIENT.config.retry_attempts
+    errors = list(read_errors("logs/extract_error_logs.jsonl"))
+    assert [(e["from_block"], e["to_block"]) for e in errors] == [(0, 49_999)]
+
+
+def test_empty_range_is_skipped(workdir, monkeypatch):
+    calls = _fake_fetch(monkeypatch, lambda f, t: None)
+
+    _run(workdir / "logs.parquet", 10, 9, 1_000)
+
+    assert calls == []
+    assert not (workdir / "logs.parquet").exists()
+
+
+def test_clients_share_one_session_per_api_key(monkeypatch):
+    monkeypatch.setattr(etherscan_extract, "_etherscan_clients", {})
+    monkeypatch.setattr(etherscan_extract, "_sessions_by_api_key", {})
+
+    mainnet = etherscan_extract.get_etherscan_client(1)
+    base = etherscan_extract.get_etherscan_client(8453)
+
+    assert mainnet is etherscan_extract.get_etherscan_client(1)
+    assert (mainnet.chainid, base.chainid) == (1, 8453)
+    assert mainnet._session is base._session
@@ -0,0 +1,158 @@
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from onchaindata.extractor.etherscan import EtherscanExtractor, EtherscanSource
+from onchaindata.extractor.exceptions import APIError, ResultWindowError
+from onchaindata.utils.etherscan_extract import (
+    _STATISTICS_UNAVAILABLE,
+    _get_resume_block,
+    _max_block_from_statistics,
+)
+
+
+def _records(blocks, address="0xaa"):
+    return [
+        {"blockNumber": block, "logIndex": 0, "contract_address": address}
+        for block in blocks
+    ]
+
+
+def test_write_part_names_file_by_block_range(tmp_path):
+    extractor = EtherscanExtractor(client=None, save_dir=str(tmp_path))
+    output_path = tmp_path / "logs.parquet"
+
+    rows = extractor.write_part(_records([5, 3]), output_path, 1, 9)
+
+    part = tmp_path / "logs.parts" / "part-000000000001-000000000009.parquet"
+    assert rows == 2
+    assert pl.read_parquet(part)["blockNumber"].to_list() == [3, 5]
+
+
+def test_write_part_skips_empty_chunks(tmp_path):
+    extractor = EtherscanExtractor(client=None, save_dir=str(tmp_path))
+
+    assert extractor.write_part([], tmp_path / "logs.parquet", 1, 9) == 0
+    assert not (tmp_path / "logs.parts").exists()
+
+
+def test_compact_parts_merges_into_existing_file(tmp_path):
+    extractor = EtherscanExtractor(client=None, save_dir=str(tmp_path))
+    output_path = tmp_path / "logs.parquet"
+    pl.DataFrame(_records([1, 2])).write_parquet(output_path)
+    extractor.write_part(_records([4, 2]), output_path, 2, 4)
+    extractor.write_part(_records([3]), output_path, 3, 3)
+
+    rows_added = extractor.compact_parts(output_path)
+
+    assert rows_added == 2
+    assert pl.read_parquet(output_path)["blockNumber"].to_list() == [1, 2, 3, 4]
+    assert not (tmp_path / "logs.parts").exists()
+
+
+def test_compact_parts_without_parts_is_a_no_op(tmp_path):
+    extractor = EtherscanExtractor(client=None, save_dir=str(tmp_path))
+
+    assert extractor.compact_parts(tmp_path / "logs.parquet") == 0
+    assert not (tmp_path / "logs.parquet").exists()
+
+
+def _metadata(tmp_path, records, row_group_size):
+    path = tmp_path / "stats.parquet"
+    pl.DataFrame(records).write_parquet(path, row_group_size=row_group_size)
+    return pq.read_metadata(path)
+
+
+def test_max_block_from_statistics_single_address(tmp_path):
+    metadata = _metadata(tmp_path, _records([1, 2, 3, 7]), row_group_size=2)
+
+    assert _max_block_from_statistics(metadata, None, None) == 7
+
+
+def test_max_block_from_statistics_row_groups_per_address(tmp_path):
+    records = _records([1, 5], "0xaa") + _records([2, 9], "0xbb")
+    metadata = _metadata(tmp_path, records, row_group_size=2)
+
+    assert _max_block_from_statistics(metadata, "contract_address", "0xaa") == 5
+    assert _max_block_from_statistics(metadata, "contract_address", "0xbb") == 9
+    assert _max_block_from_statistics(metadata, "contract_address", "0xcc") is None
+
+
+def test_max_block_from_statistics_mixed_row_group(tmp_path):
+    records = _records([1], "0xaa") + _records([2], "0xcc")
+    metadata = _metadata(tmp_path, records, row_group_size=2)
+
+    result = _max_block_from_statistics(metadata, "contract_address", "0xbb")
+
+    assert result is _STATISTICS_UNAVAILABLE
+
+
+@pytest.mark.parametrize(
+    "item, error",
+    [
+        ({"status": "0", "message": "NOTOK", "result": "Max rate limit reached"}, APIError),
+        ("Result window is too large, PageNo x Offset size must be <= 10000", ResultWindowError),
+        ("Invalid API Key", APIError),
+    ],
+)
+def test_error_results_raise(item, error):
+    with pytest.raises(error):
+        EtherscanSource._raise_for_error_result(item)
+
+
+def test_records_pass_error_result_check():
+    EtherscanSource._raise_for_error_result({"blockNumber": "0x1", "topics": []})
+    EtherscanSource._raise_for_error_result({"status": "1", "message": "OK", "result": []})
+
+
+def test_large_wei_value_after_inferred_rows_is_stored_as_decimal(tmp_path):
+    extractor = EtherscanExtractor(client=None, save_dir=str(tmp_path))
+    output_path = tmp_path / "transactions.parquet"
+    records = [
+        {"blockNumber": block, "address": "0xaa", "value": 10**18}
+        for block in range(150)
+    ]
+    records.append({"blockNumber": 150, "address": "0xaa", "value": 2**70})
+
+    extractor.write_part(records, output_path, 0, 150)
+    extractor.compact_parts(output_path)
+
+    schema = pq.read_metadata(output_path).schema.to_arrow_schema()
+    assert str(schema.field("value").type) == "decimal128(38, 0)"
+    assert pl.read_parquet(output_path)["value"][-1] == 2**70
+
+
+def _write_legacy_file(path):
+    # Files written before wei columns were stored as decimals
+    pl.DataFrame(
+        {
+            "blockNumber": [1, 2],
+            "address": ["0xaa", "0xaa"],
+            "value": pl.Series([10**18, 2**70], dtype=pl.Int128),
+        }
+    ).write_parquet(path)
+
+
+def test_resume_block_of_legacy_int128_file(tmp_path):
+    path = tmp_path / "transactions.parquet"
+    _write_legacy_file(path)
+
+    assert _get_resume_block(path, "0xaa", single_address=True) == 2
+    assert _get_resume_block(path, "0xaa") == 2
+
+
+def test_compact_parts_upgrades_legacy_int128_file(tmp_path):
+    extractor = EtherscanExtractor(client=None, save_dir=str(tmp_path))
+    output_path = tmp_path / "transactions.parquet"
+    _write_legacy_file(output_path)
+    extractor.write_part(
+        [{"blockNumber": 3, "address": "0xaa", "value": 5}], output_path, 3, 3
+    )
+
+    rows_added = extractor.compact_parts(output_path)
+
+    assert rows_added == 1
+    assert not (tmp_path / "transactions.parts").exists()
+    schema = pq.read_metadata(output_path).schema.to_arrow_schema()
+    assert str(schema.field("value").type) == "decimal128(38, 0)"
+    assert pl.read_parquet(output_path)["value"].to_list() == [10**18, 2**70, 5]
@@ -0,0 +1,47 @@
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+
+from onchaindata.extractor.rate_limiter import RateLimitedSession
+
+
+class OkAdapter(BaseAdapter):
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response.url = request.url
+        response._content = b"{}"
+        return response
+
+    def close(self):
+        pass
+
+
+def _session(calls_per_second):
+    session = RateLimitedSession(calls_per_second=calls_per_second)
+    session.mount("https://", OkAdapter())
+    return session
+
+
+def test_prepared_requests_sent_directly_are_rate_limited():
+    session = _session(calls_per_second=20)
+    prepared = requests.Request("GET", "https://example.com/api").prepare()
+
+    start = time.monotonic()
+    for _ in range(4):
+        session.send(prepared)
+    elapsed = time.monotonic() - start
+
+    assert session.request_count == 4
+    assert elapsed >= 3 * 0.05 * 0.9
+
+
+def test_get_is_rate_limited_once_per_request():
+    session = _session(calls_per_second=20)
+
+    for _ in range(3):
+        session.get("https://example.com/api")
+
+    assert session.request_count == 3